@@ -0,0 +1,9 @@
+"""Optional Numba JIT decorator that degrades to plain Python when Numba is missing."""
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - exercised only without numba
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda f: f
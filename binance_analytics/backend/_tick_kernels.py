@@ -0,0 +1,45 @@
+"""Fused reduction kernels for tick buffer aggregation."""
+import math
+from typing import Tuple
+
+import numpy as np
+
+from backend._njit import njit
+
+
+# Eager signature: compiled (or loaded from cache) at import, not on the first flush
+@njit("UniTuple(float64, 6)(float64[::1], float64[::1])", cache=True, fastmath=True)
+def summarize(p: np.ndarray, q: np.ndarray) -> Tuple[float, float, float, float, float, float]:
+    """
+    Single pass over a window of ticks.
+    
+    Returns (mean, std, min, max, total_volume, vwap) for prices `p` and
+    quantities `q`. Both arrays must be non-empty and of equal length.
+    """
+    n = p.shape[0]
+    ref = p[0]  # shift prices so the sum of squares stays well-conditioned
+    s = 0.0
+    s2 = 0.0
+    mn = p[0]
+    mx = p[0]
+    vs = 0.0
+    pq = 0.0
+    
+    for i in range(n):
+        pi = p[i]
+        qi = q[i]
+        x = pi - ref
+        s += x
+        s2 += x * x
+        if pi < mn:
+            mn = pi
+        if pi > mx:
+            mx = pi
+        vs += qi
+        pq += pi * qi
+    
+    mean = s / n
+    var = s2 / n - mean * mean
+    std = math.sqrt(var) if var > 0 else 0.0
+    vwap = pq / vs if vs > 0 else 0.0
+    return ref + mean, std, mn, mx, vs, vwap
@@ -1,5 +1,6 @@
 """Advanced analytics module for quant trading."""
 import logging
+import math
 from typing import Dict, List, Optional, Tuple
 from collections import defaultdict, deque
 from datetime import datetime
@@ -7,9 +8,75 @@ import numpy as np
 
 from backend.models import AnalyticsMetrics, SampledWindow
 from backend import utils
+from backend._njit import njit
 
 logger = logging.getLogger(__name__)
 
+SMA_PERIOD = 20
+EMA_PERIOD = 20
+EMA_ALPHA = 2.0 / (EMA_PERIOD + 1)
+RSI_PERIOD = 14
+BACKTEST_WINDOW = 20
+
+
+@njit(cache=True)
+def _mean_reversion_kernel(prices: np.ndarray, window: int,
+                           entry: float, exit: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Run the mean-reversion backtest over a price array.
+    
+    Z-scores use a rolling mean/variance over the trailing `window` prices,
+    updated in O(1) per step. Returns (pnls, types) for each closed trade,
+    where type is 1 for long and -1 for short.
+    """
+    n = prices.shape[0]
+    pnls = np.empty(n, dtype=np.float64)
+    types = np.empty(n, dtype=np.int8)
+    n_trades = 0
+    
+    # Shift by the first price to keep the running variance stable
+    ref = prices[0]
+    s = 0.0
+    s2 = 0.0
+    for i in range(window):
+        x = prices[i] - ref
+        s += x
+        s2 += x * x
+    
+    position = 0
+    entry_price = 0.0
+    
+    for i in range(window, n):
+        mean = s / window
+        var = s2 / window - mean * mean
+        z = 0.0
+        if var > 1e-12 * (s2 / window):
+            z = (prices[i] - ref - mean) / math.sqrt(var)
+        
+        # Entry signals
+        if position == 0:
+            if z > entry:  # Overbought - short
+                position = -1
+                entry_price = prices[i]
+            elif z < -entry:  # Oversold - long
+                position = 1
+                entry_price = prices[i]
+        
+        # Exit signals
+        elif abs(z) < exit:
+            pnls[n_trades] = (prices[i] - entry_price) * position
+            types[n_trades] = position
+            n_trades += 1
+            position = 0
+        
+        # Slide the window forward
+        x_in = prices[i] - ref
+        x_out = prices[i - window] - ref
+        s += x_in - x_out
+        s2 += x_in * x_in - x_out * x_out
+    
+    return pnls[:n_trades], types[:n_trades]
+
 
 class AnalyticsEngine:
     """Compute real-time trading analytics."""
@@ -24,69 +91,135 @@ class AnalyticsEngine:
         self.max_history = max_history
         
         # Price history per symbol
-        self.price_history: Dict[str, deque] = defaultdict(lambda: deque(maxlen=max_history))
-        self.volume_history: Dict[str, deque] = defaultdict(lambda: deque(maxlen=max_history))
-        self.timestamp_history: Dict[str, deque] = defaultdict(lambda: deque(maxlen=max_history))
-        self.returns_history: Dict[str, deque] = defaultdict(lambda: deque(maxlen=max_history))
+        self.price_history: Dict[str, utils.RingBuffer] = defaultdict(lambda: utils.RingBuffer(max_history))
+        self.volume_history: Dict[str, utils.RingBuffer] = defaultdict(lambda: utils.RingBuffer(max_history))
+        self.timestamp_history: Dict[str, utils.RingBuffer] = defaultdict(lambda: utils.RingBuffer(max_history))
+        self.returns_history: Dict[str, utils.RingBuffer] = defaultdict(lambda: utils.RingBuffer(max_history))
         
         # Metrics cache
         self.latest_metrics: Dict[str, AnalyticsMetrics] = {}
+        
+        # Incremental state per symbol so each window update is O(1).
+        # Sums are taken relative to the first price seen (_ref) to keep
+        # the sum-of-squares variance numerically stable.
+        self._ref: Dict[str, float] = {}
+        self._sum: Dict[str, float] = defaultdict(float)
+        self._sumsq: Dict[str, float] = defaultdict(float)
+        self._recent_window: Dict[str, deque] = defaultdict(lambda: deque(maxlen=window_size))
+        self._recent_sum: Dict[str, float] = defaultdict(float)
+        self._recent_sumsq: Dict[str, float] = defaultdict(float)
+        self._sma_window: Dict[str, deque] = defaultdict(lambda: deque(maxlen=SMA_PERIOD))
+        self._sma_sum: Dict[str, float] = defaultdict(float)
+        self._ema: Dict[str, Optional[float]] = {}
+        self._rsi_avg_gain: Dict[str, float] = defaultdict(float)
+        self._rsi_avg_loss: Dict[str, float] = defaultdict(float)
+        self._rsi_changes: Dict[str, int] = defaultdict(int)
+        
+        # Running pair sums over windows that share a timestamp, keyed by sorted
+        # (sym1, sym2): [n, Sx, Sy, Sxx, Syy, Sxy] of prices shifted by the first pair
+        self._pair_stats: Dict[Tuple[str, str], List[float]] = {}
+        self._pair_ref: Dict[Tuple[str, str], Tuple[float, float]] = {}
+        self._pair_history: Dict[Tuple[str, str], Tuple[utils.RingBuffer, utils.RingBuffer]] = {}
     
     def process_window(self, window: SampledWindow) -> AnalyticsMetrics:
         """Process a 5-sec sampled window and compute metrics."""
         symbol = window.symbol
+        price = window.mean_price
+        history = self.price_history[symbol]
+        
+        prev_price = history[-1] if history else None
         
         # Add to history
-        self.price_history[symbol].append(window.mean_price)
+        evicted = history.append(price)
         self.volume_history[symbol].append(window.total_volume)
         self.timestamp_history[symbol].append(window.timestamp)
         
+        # Pair with every symbol that already has a window at this timestamp
+        for other, timestamps in self.timestamp_history.items():
+            if other != symbol and len(timestamps) and timestamps[-1] == window.timestamp:
+                self._update_pair(symbol, price, other, self.price_history[other][-1])
+        
         # Calculate returns for GARCH
-        if len(self.price_history[symbol]) > 1:
-            ret = (window.mean_price - self.price_history[symbol][-2]) / self.price_history[symbol][-2]
+        if prev_price is not None:
+            ret = (price - prev_price) / prev_price
             self.returns_history[symbol].append(ret)
         
-        # Compute metrics
-        prices = list(self.price_history[symbol])
-        volumes = list(self.volume_history[symbol])
-        returns = list(self.returns_history[symbol])
+        # Full-history mean/std from running sums
+        ref = self._ref.setdefault(symbol, price)
+        x = price - ref
+        self._sum[symbol] += x
+        self._sumsq[symbol] += x * x
+        if evicted is not None:
+            e = evicted - ref
+            self._sum[symbol] -= e
+            self._sumsq[symbol] -= e * e
         
-        mean_price = utils.calculate_mean(prices)
-        std_price = utils.calculate_std(prices, mean_price)
+        n = len(history)
+        mean_price = ref + self._sum[symbol] / n
+        std_price = utils.calculate_std_from_sums(self._sum[symbol], self._sumsq[symbol], n)
         volatility = std_price / mean_price if mean_price > 0 else 0.0
         
         # Z-score based on recent window
-        recent_prices = prices[-self.window_size:] if len(prices) >= self.window_size else prices
-        recent_mean = utils.calculate_mean(recent_prices)
-        recent_std = utils.calculate_std(recent_prices, recent_mean)
-        z_score = utils.calculate_z_score(window.mean_price, recent_mean, recent_std)
+        recent = self._recent_window[symbol]
+        if len(recent) == recent.maxlen:
+            e = recent[0]
+            self._recent_sum[symbol] -= e
+            self._recent_sumsq[symbol] -= e * e
+        recent.append(x)
+        self._recent_sum[symbol] += x
+        self._recent_sumsq[symbol] += x * x
+        
+        recent_mean = ref + self._recent_sum[symbol] / len(recent)
+        recent_std = utils.calculate_std_from_sums(self._recent_sum[symbol], self._recent_sumsq[symbol], len(recent))
+        z_score = utils.calculate_z_score(price, recent_mean, recent_std)
         
         # Moving averages
-        sma_20 = utils.calculate_sma(prices, 20)
-        ema_20 = utils.calculate_ema(prices, 20)
+        sma = self._sma_window[symbol]
+        if len(sma) == sma.maxlen:
+            self._sma_sum[symbol] -= sma[0]
+        sma.append(x)
+        self._sma_sum[symbol] += x
+        sma_20 = ref + self._sma_sum[symbol] / len(sma)
         
-        # RSI
-        rsi = utils.calculate_rsi(prices, 14)
+        ema = self._ema.get(symbol)
+        ema = price if ema is None else price * EMA_ALPHA + ema * (1 - EMA_ALPHA)
+        self._ema[symbol] = ema
+        ema_20 = ema if n >= EMA_PERIOD else mean_price
+        
+        # RSI (Wilder smoothing, seeded with the simple average of the first period)
+        rsi = 50.0
+        if prev_price is not None:
+            change = price - prev_price
+            gain = max(change, 0.0)
+            loss = max(-change, 0.0)
+            count = self._rsi_changes[symbol] = self._rsi_changes[symbol] + 1
+            
+            if count <= RSI_PERIOD:
+                self._rsi_avg_gain[symbol] += gain / RSI_PERIOD
+                self._rsi_avg_loss[symbol] += loss / RSI_PERIOD
+            else:
+                self._rsi_avg_gain[symbol] = (self._rsi_avg_gain[symbol] * (RSI_PERIOD - 1) + gain) / RSI_PERIOD
+                self._rsi_avg_loss[symbol] = (self._rsi_avg_loss[symbol] * (RSI_PERIOD - 1) + loss) / RSI_PERIOD
+            
+            if count >= RSI_PERIOD:
+                rsi = utils.calculate_rsi_from_averages(self._rsi_avg_gain[symbol], self._rsi_avg_loss[symbol])
         
         # Trend detection
-        trend = utils.detect_trend(sma_20, ema_20, window.mean_price)
+        trend = utils.detect_trend(sma_20, ema_20, price)
         
         # ADF test (stationarity)
+        prices = self._price_array(symbol)
         adf_pvalue = utils.calculate_adf_test_simple(prices)
         
         # GARCH volatility forecast
-        garch_forecast = utils.calculate_garch_volatility_forecast(returns, horizon=1)
+        garch_forecast = utils.calculate_garch_volatility_forecast(self.returns_history[symbol].view(), horizon=1)
         
         # Correlation (BTC-ETH)
         correlation = None
-        if symbol == "BTCUSDT" and "ETHUSDT" in self.price_history:
-            eth_prices = list(self.price_history["ETHUSDT"])
-            if len(eth_prices) == len(prices):
-                correlation = utils.calculate_correlation(prices, eth_prices)
-        elif symbol == "ETHUSDT" and "BTCUSDT" in self.price_history:
-            btc_prices = list(self.price_history["BTCUSDT"])
-            if len(prices) == len(btc_prices):
-                correlation = utils.calculate_correlation(btc_prices, prices)
+        if symbol == "BTCUSDT":
+            correlation = self._pair_correlation(symbol, "ETHUSDT")
+        elif symbol == "ETHUSDT":
+            correlation = self._pair_correlation(symbol, "BTCUSDT")
         
         metrics = AnalyticsMetrics(
             timestamp=window.timestamp,
@@ -107,6 +240,57 @@ class AnalyticsEngine:
         self.latest_metrics[symbol] = metrics
         return metrics
     
+    def _update_pair(self, sym1: str, price1: float, sym2: str, price2: float) -> None:
+        """Add an aligned price pair to the running correlation sums in O(1)."""
+        if sym2 < sym1:
+            sym1, price1, sym2, price2 = sym2, price2, sym1, price1
+        key = (sym1, sym2)
+        
+        stats = self._pair_stats.get(key)
+        if stats is None:
+            stats = self._pair_stats[key] = [0.0] * 6
+            self._pair_ref[key] = (price1, price2)
+            self._pair_history[key] = (utils.RingBuffer(self.max_history), utils.RingBuffer(self.max_history))
+        
+        ref1, ref2 = self._pair_ref[key]
+        hist1, hist2 = self._pair_history[key]
+        x = price1 - ref1
+        y = price2 - ref2
+        
+        ex = hist1.append(x)
+        ey = hist2.append(y)
+        if ex is not None:
+            stats[0] -= 1
+            stats[1] -= ex
+            stats[2] -= ey
+            stats[3] -= ex * ex
+            stats[4] -= ey * ey
+            stats[5] -= ex * ey
+        
+        stats[0] += 1
+        stats[1] += x
+        stats[2] += y
+        stats[3] += x * x
+        stats[4] += y * y
+        stats[5] += x * y
+    
+    def _pair_correlation(self, sym1: str, sym2: str) -> Optional[float]:
+        """Pearson correlation of two symbols from their running pair sums."""
+        key = (sym1, sym2) if sym1 < sym2 else (sym2, sym1)
+        stats = self._pair_stats.get(key)
+        if stats is None or stats[0] < 2:
+            return None
+        
+        n, sx, sy, sxx, syy, sxy = stats
+        var_x = n * sxx - sx * sx
+        var_y = n * syy - sy * sy
+        
+        # Treat round-off sized variance as a flat series
+        if var_x <= 1e-12 * n * sxx or var_y <= 1e-12 * n * syy:
+            return None
+        
+        return (n * sxy - sx * sy) / math.sqrt(var_x * var_y)
+    
     def get_metrics(self, symbol: str) -> Optional[AnalyticsMetrics]:
         """Get latest metrics for symbol."""
         return self.latest_metrics.get(symbol)
@@ -115,132 +299,105 @@ class AnalyticsEngine:
         """Get all latest metrics."""
         return self.latest_metrics.copy()
     
+    def _price_array(self, symbol: str) -> np.ndarray:
+        """Price history as an oldest-first array (a view into the ring buffer when possible)."""
+        return self.price_history[symbol].view()
+    
     def get_price_history(self, symbol: str, limit: int = 100) -> List[float]:
         """Get price history for symbol."""
-        prices = list(self.price_history[symbol])
-        return prices[-limit:] if len(prices) > limit else prices
+        prices = self._price_array(symbol)
+        return (prices[-limit:] if len(prices) > limit else prices).tolist()
     
     def get_correlation_matrix(self) -> Dict[str, float]:
         """Get correlation matrix between all symbols."""
+        symbols, corr_matrix = self._correlation_matrix()
         result = {}
-        symbols = list(self.price_history.keys())
         
         for i, sym1 in enumerate(symbols):
-            for sym2 in symbols[i+1:]:
-                prices1 = list(self.price_history[sym1])
-                prices2 = list(self.price_history[sym2])
-                
-                if len(prices1) == len(prices2) and len(prices1) > 0:
-                    corr = utils.calculate_correlation(prices1, prices2)
-                    if corr is not None:
-                        key = f"{sym1}-{sym2}"
-                        result[key] = corr
+            for j in range(i + 1, len(symbols)):
+                if not np.isnan(corr_matrix[i, j]):
+                    key = f"{sym1}-{symbols[j]}"
+                    result[key] = float(corr_matrix[i, j])
         
         return result
     
+    def _correlation_matrix(self) -> Tuple[List[str], np.ndarray]:
+        """
+        Pearson correlation between every pair of symbols.
+        
+        Each entry is read from the running pair sums, so the full matrix is
+        O(S^2) regardless of history length. Pairs without enough aligned
+        windows or with a flat series are NaN.
+        """
+        symbols = list(self.price_history.keys())
+        corr_matrix = np.full((len(symbols), len(symbols)), np.nan)
+        np.fill_diagonal(corr_matrix, 1.0)
+        
+        for i, sym1 in enumerate(symbols):
+            for j in range(i + 1, len(symbols)):
+                corr = self._pair_correlation(sym1, symbols[j])
+                if corr is not None:
+                    corr_matrix[i, j] = corr_matrix[j, i] = corr
+        
+        return symbols, corr_matrix
+    
     def detect_anomalies(self, symbol: str, z_threshold: float = 3.0) -> List[float]:
         """Detect price anomalies using Z-score."""
-        prices = list(self.price_history[symbol])
+        prices = self._price_array(symbol)
         if len(prices) < 10:
             return []
         
-        mean = utils.calculate_mean(prices)
-        std = utils.calculate_std(prices, mean)
-        
-        anomalies = []
-        for price in prices:
-            z = utils.calculate_z_score(price, mean, std)
-            if abs(z) > z_threshold:
-                anomalies.append(price)
+        std = prices.std()
+        if std == 0:
+            return []
         
-        return anomalies
+        z_scores = (prices - prices.mean()) / std
+        return prices[np.abs(z_scores) > z_threshold].tolist()
     
     def backtest_mean_reversion(self, symbol: str, 
                                 entry_threshold: float = 2.0,
                                 exit_threshold: float = 0.0) -> Dict:
         """Simple mean-reversion backtest."""
-        prices = list(self.price_history[symbol])
-        if len(prices) < 20:
+        prices = self._price_array(symbol)
+        if len(prices) < BACKTEST_WINDOW:
             return {"trades": 0, "wins": 0, "losses": 0}
         
-        trades = []
-        position = None
+        pnls, _ = _mean_reversion_kernel(prices, BACKTEST_WINDOW, entry_threshold, exit_threshold)
         
-        for i in range(20, len(prices)):
-            recent = prices[i-20:i]
-            mean = utils.calculate_mean(recent)
-            std = utils.calculate_std(recent, mean)
-            z = utils.calculate_z_score(prices[i], mean, std)
-            
-            # Entry signals
-            if position is None:
-                if z > entry_threshold:  # Overbought - short
-                    position = {"type": "short", "price": prices[i], "index": i}
-                elif z < -entry_threshold:  # Oversold - long
-                    position = {"type": "long", "price": prices[i], "index": i}
-            
-            # Exit signals
-            elif position and abs(z) < exit_threshold:
-                pnl = 0
-                if position["type"] == "long":
-                    pnl = prices[i] - position["price"]
-                else:
-                    pnl = position["price"] - prices[i]
-                
-                trades.append({"pnl": pnl, "type": position["type"]})
-                position = None
-        
-        wins = sum(1 for t in trades if t["pnl"] > 0)
-        losses = sum(1 for t in trades if t["pnl"] <= 0)
-        total_pnl = sum(t["pnl"] for t in trades)
+        trades = len(pnls)
+        wins = int((pnls > 0).sum())
+        losses = trades - wins
+        total_pnl = float(pnls.sum())
         
         return {
-            "trades": len(trades),
+            "trades": trades,
             "wins": wins,
             "losses": losses,
-            "win_rate": wins / len(trades) if trades else 0.0,
+            "win_rate": wins / trades if trades else 0.0,
             "total_pnl": total_pnl,
-            "avg_pnl": total_pnl / len(trades) if trades else 0.0,
+            "avg_pnl": total_pnl / trades if trades else 0.0,
         }
     
     def cluster_by_correlation(self, min_correlation: float = 0.7) -> List[List[str]]:
         """Cluster symbols by correlation."""
-        symbols = list(self.price_history.keys())
+        symbols, corr_matrix = self._correlation_matrix()
         if len(symbols) < 2:
             return [[s] for s in symbols]
         
-        # Build correlation matrix
-        n = len(symbols)
-        corr_matrix = [[0.0] * n for _ in range(n)]
-        
-        for i, sym1 in enumerate(symbols):
-            for j, sym2 in enumerate(symbols):
-                if i == j:
-                    corr_matrix[i][j] = 1.0
-                elif i < j:
-                    prices1 = list(self.price_history[sym1])
-                    prices2 = list(self.price_history[sym2])
-                    if len(prices1) == len(prices2) and len(prices1) > 0:
-                        corr = utils.calculate_correlation(prices1, prices2)
-                        if corr is not None:
-                            corr_matrix[i][j] = corr_matrix[j][i] = corr
+        corr_matrix = np.nan_to_num(corr_matrix, nan=0.0)
         
         # Simple clustering
         clusters = []
-        assigned = set()
+        assigned = np.zeros(len(symbols), dtype=bool)
         
         for i, sym1 in enumerate(symbols):
-            if i in assigned:
+            if assigned[i]:
                 continue
             
-            cluster = [sym1]
-            assigned.add(i)
-            
-            for j, sym2 in enumerate(symbols):
-                if j not in assigned and corr_matrix[i][j] >= min_correlation:
-                    cluster.append(sym2)
-                    assigned.add(j)
+            assigned[i] = True
+            members = np.flatnonzero(~assigned & (corr_matrix[i] >= min_correlation))
+            assigned[members] = True
             
-            clusters.append(cluster)
+            clusters.append([sym1] + [symbols[j] for j in members])
         
         return clusters
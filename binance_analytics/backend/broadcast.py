@@ -0,0 +1,127 @@
+"""Fan-out of live analytics to WebSocket subscribers."""
+import asyncio
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    from orjson import dumps as _orjson_dumps
+    
+    def _dumps(obj: Any) -> str:
+        return _orjson_dumps(obj).decode()
+except ImportError:  # pragma: no cover - orjson is optional
+    from json import dumps as _dumps
+
+logger = logging.getLogger(__name__)
+
+
+class BroadcastHub:
+    """
+    Broadcast JSON messages to every connected WebSocket client.
+    
+    Messages are serialized once on publish and queued per client. Each
+    client's sender drains whatever has accumulated (up to `max_batch`)
+    and sends it as a single JSON array frame, so bursts cost one frame
+    instead of one per message.
+    
+    A slow client whose queue fills up loses its oldest message. Streams
+    whose messages depend on earlier ones pass `resync`: an overflowing
+    client then has its whole backlog replaced by the messages `resync()`
+    returns, so it always keeps the state it needs to decode what follows.
+    """
+    
+    def __init__(self, max_queue: int = 1024, max_batch: int = 128,
+                 resync: Optional[Callable[[], Iterable[Any]]] = None):
+        self.max_queue = max_queue
+        self.max_batch = max_batch
+        self.resync = resync
+        self.clients: Set[asyncio.Queue] = set()
+    
+    def publish(self, message: Any) -> None:
+        """Serialize a message and queue it for every client."""
+        if self.clients:
+            self.publish_raw(_dumps(message))
+    
+    def publish_raw(self, data: str) -> None:
+        """Queue an already-serialized JSON message for every client."""
+        for queue in self.clients:
+            if queue.full():
+                # Slow client: drop rather than block the publisher
+                if self.resync is None:
+                    queue.get_nowait()
+                else:
+                    self._resync(queue)
+            queue.put_nowait(data)
+    
+    def _resync(self, queue: asyncio.Queue) -> None:
+        """Replace a client's backlog with the messages it needs to pick up from now."""
+        while not queue.empty():
+            queue.get_nowait()
+        for message in self.resync():
+            queue.put_nowait(_dumps(message))
+    
+    async def serve(self, websocket, initial: Iterable[Any] = ()) -> None:
+        """Send batched messages to an accepted WebSocket until it disconnects."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_queue)
+        for message in initial:
+            queue.put_nowait(_dumps(message))
+        self.clients.add(queue)
+        
+        try:
+            while True:
+                batch = [await queue.get()]
+                while len(batch) < self.max_batch and not queue.empty():
+                    batch.append(queue.get_nowait())
+                
+                await websocket.send_text("[" + ",".join(batch) + "]")
+        except Exception as e:
+            logger.debug(f"Stream client disconnected: {e}")
+        finally:
+            self.clients.discard(queue)
+
+
+class PriceDeltaEncoder:
+    """
+    Quantize window prices into small integer deltas for the wire.
+    
+    The first window seen for a symbol fixes its session baseline
+    (timestamp in ms, price in 1/PRICE_SCALE units). Each later window is
+    sent as `[symbol, dt_ms, dp, qty]` relative to that baseline rather
+    than to the previous message, so a client that drops messages never
+    drifts. Clients receive every baseline on connect via snapshot(), and
+    again if their queue overflows (BroadcastHub's `resync`).
+    """
+    
+    PRICE_SCALE = 100  # cent precision
+    QTY_SCALE = 1_000_000
+    
+    def __init__(self):
+        self.baselines: Dict[str, Tuple[int, int]] = {}
+    
+    def _baseline_message(self, symbol: str) -> Dict[str, Any]:
+        t, p = self.baselines[symbol]
+        return {
+            "type": "baseline",
+            "symbol": symbol,
+            "t": t,
+            "p": p,
+            "price_scale": self.PRICE_SCALE,
+            "qty_scale": self.QTY_SCALE,
+        }
+    
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Baselines for every symbol seen so far."""
+        return [self._baseline_message(symbol) for symbol in self.baselines]
+    
+    def encode(self, symbol: str, timestamp: float, price: float, quantity: float) -> List[Any]:
+        """Messages to publish for one window: a baseline the first time, then the delta."""
+        t = int(timestamp)
+        p = round(price * self.PRICE_SCALE)
+        messages: List[Any] = []
+        
+        base = self.baselines.get(symbol)
+        if base is None:
+            base = self.baselines[symbol] = (t, p)
+            messages.append(self._baseline_message(symbol))
+        
+        messages.append([symbol, t - base[0], p - base[1], round(quantity * self.QTY_SCALE)])
+        return messages
@@ -0,0 +1,53 @@
+"""In-process TTL cache for read-heavy API responses."""
+import functools
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class ResponseCache:
+    """
+    Small TTL cache keyed on (namespace, call arguments).
+    
+    Entries expire after their TTL or when their namespace prefix is
+    invalidated, e.g. once per sampling cycle when new analytics land.
+    """
+    
+    def __init__(self):
+        self._entries: Dict[Tuple[str, Hashable], Tuple[float, Any]] = {}
+    
+    def get(self, key: Tuple[str, Hashable]) -> Optional[Any]:
+        """Return a live cached value, or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        return value
+    
+    def set(self, key: Tuple[str, Hashable], value: Any, expire: float) -> None:
+        """Store a value for `expire` seconds."""
+        self._entries[key] = (time.monotonic() + expire, value)
+    
+    def invalidate(self, prefix: str = "") -> None:
+        """Drop every entry whose namespace starts with `prefix`."""
+        if not prefix:
+            self._entries.clear()
+            return
+        for key in [k for k in self._entries if k[0].startswith(prefix)]:
+            del self._entries[key]
+    
+    def cached(self, namespace: str, expire: float = 5.0) -> Callable:
+        """Decorate an async endpoint so its result is cached per argument set."""
+        def decorator(func: Callable) -> Callable:
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                key = (namespace, (args, tuple(sorted(kwargs.items()))))
+                value = self.get(key)
+                if value is None:
+                    value = await func(*args, **kwargs)
+                    self.set(key, value, expire)
+                return value
+            return wrapper
+        return decorator
@@ -1,16 +1,25 @@
 """Binance WebSocket data ingestion and SQLite persistence."""
 import asyncio
-import json
+import csv
+import io
 import logging
 import sqlite3
 import time
-from typing import Dict, List, Optional, Callable
+from array import array
+from collections import deque
+from typing import Deque, Dict, Iterator, List, Optional, Callable
 from datetime import datetime
 import aiohttp
 import numpy as np
 
 from backend.models import Tick, SampledWindow
 from backend import utils
+from backend._tick_kernels import summarize
+
+try:
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover - orjson is optional
+    from json import loads as _loads
 
 logger = logging.getLogger(__name__)
 
@@ -39,16 +48,18 @@ class BinanceWebSocketClient:
     
     async def connect(self) -> None:
         """Establish WebSocket connection with reconnection logic."""
+        # Build combined stream URL
+        streams = "/".join([f"{sym}@aggTrade" for sym in self.symbols])
+        url = f"{BINANCE_WS_URL}/{streams}"
+        
         while self.reconnect_attempts < self.max_reconnect_attempts:
             try:
-                self.session = aiohttp.ClientSession()
-                
-                # Build combined stream URL
-                streams = "/".join([f"{sym}@aggTrade" for sym in self.symbols])
-                url = f"{BINANCE_WS_URL}/{streams}"
+                # Reuse the session across reconnects; only a connector failure forces a new one
+                if self.session is None or self.session.closed:
+                    self.session = aiohttp.ClientSession()
                 
                 logger.info(f"Connecting to {url}")
-                self.ws = await self.session.ws_connect(url)
+                self.ws = await self.session.ws_connect(url, heartbeat=30, receive_timeout=60, max_msg_size=0)
                 
                 self.is_connected = True
                 self.reconnect_attempts = 0
@@ -56,12 +67,16 @@ class BinanceWebSocketClient:
                 logger.info("✅ Binance WebSocket connected!")
                 
                 await self._listen()
+                self.is_connected = False
                 
             except Exception as e:
                 logger.error(f"WebSocket error: {e}")
                 self.is_connected = False
                 self.reconnect_attempts += 1
                 
+                if isinstance(e, aiohttp.ClientConnectorError):
+                    await self.session.close()
+                
                 if self.reconnect_attempts >= self.max_reconnect_attempts:
                     logger.error("Max reconnection attempts reached!")
                     break
@@ -69,10 +84,9 @@ class BinanceWebSocketClient:
                 wait_time = utils.exponential_backoff(self.reconnect_attempts)
                 logger.info(f"Reconnecting in {wait_time:.1f}s (attempt {self.reconnect_attempts})")
                 await asyncio.sleep(wait_time)
-            
-            finally:
-                if self.session:
-                    await self.session.close()
+        
+        if self.session:
+            await self.session.close()
     
     async def _listen(self) -> None:
         """Listen to incoming WebSocket messages."""
@@ -91,8 +105,12 @@ class BinanceWebSocketClient:
     
     async def _handle_message(self, data: str) -> None:
         """Parse and handle incoming trade message."""
+        # aggTrade payloads are JSON objects; skip anything else without parsing
+        if data[:1] != "{":
+            return
+        
         try:
-            msg = json.loads(data)
+            msg = _loads(data)
             
             # Binance aggTrade format
             if "s" in msg and "p" in msg and "q" in msg:
@@ -136,55 +154,52 @@ class TickBuffer:
     """Buffer for 5-second tick aggregation."""
     
     def __init__(self):
-        self.buffer: Dict[str, List[Tick]] = {}
-        self.last_flush = time.time()
+        # Per-symbol unboxed C doubles; Tick objects are never kept here
+        self.prices: Dict[str, array] = {}
+        self.qtys: Dict[str, array] = {}
     
-    def add(self, tick: Tick) -> None:
+    def add(self, symbol: str, price: float, quantity: float) -> None:
         """Add tick to buffer."""
-        if tick.symbol not in self.buffer:
-            self.buffer[tick.symbol] = []
-        self.buffer[tick.symbol].append(tick)
-    
-    def should_flush(self, interval_ms: int = 5000) -> bool:
-        """Check if buffer should be flushed."""
-        elapsed = (time.time() - self.last_flush) * 1000
-        return elapsed >= interval_ms
+        prices = self.prices.get(symbol)
+        if prices is None:
+            prices = self.prices[symbol] = array("d")
+            self.qtys[symbol] = array("d")
+        prices.append(price)
+        self.qtys[symbol].append(quantity)
     
     def flush(self) -> Dict[str, SampledWindow]:
         """Aggregate and return sampled windows."""
         windows = {}
         current_time = time.time() * 1000
         
-        for symbol, ticks in self.buffer.items():
-            if not ticks:
+        for symbol, prices in self.prices.items():
+            n = len(prices)
+            if n == 0:
                 continue
             
-            prices = [t.price for t in ticks]
-            quantities = [t.quantity for t in ticks]
-            
-            mean_price = utils.calculate_mean(prices)
-            std_price = utils.calculate_std(prices, mean_price)
-            min_price = min(prices)
-            max_price = max(prices)
-            total_volume = sum(quantities)
-            vwap = utils.calculate_vwap(prices, quantities)
+            # Zero-copy views over the array buffers
+            mean_price, std_price, min_price, max_price, total_volume, vwap = summarize(
+                np.frombuffer(prices, dtype=np.float64), np.frombuffer(self.qtys[symbol], dtype=np.float64)
+            )
             
             window = SampledWindow(
                 timestamp=current_time,
                 symbol=symbol,
-                mean_price=mean_price,
-                std_price=std_price,
-                min_price=min_price,
-                max_price=max_price,
-                total_volume=total_volume,
-                tick_count=len(ticks),
-                vwap=vwap,
+                mean_price=float(mean_price),
+                std_price=float(std_price),
+                min_price=float(min_price),
+                max_price=float(max_price),
+                total_volume=float(total_volume),
+                tick_count=n,
+                vwap=float(vwap),
             )
             
             windows[symbol] = window
+            
+            # Fresh arrays: the old ones may still be exported to NumPy and cannot be resized
+            self.prices[symbol] = array("d")
+            self.qtys[symbol] = array("d")
         
-        self.buffer = {}
-        self.last_flush = time.time()
         return windows
 
 
@@ -194,6 +209,39 @@ class TickDatabase:
     def __init__(self, db_path: str = DB_PATH):
         self.db_path = db_path
         self.init_db()
+        
+        # Long-lived write connection; inserts are buffered and written in batches by flush()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache
+        self._conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB memory-mapped I/O
+        
+        # Single reused cursor; constant SQL text keeps the statement cache hot
+        self._cur = self._conn.cursor()
+        self._sql_tick = """
+            INSERT INTO ticks (timestamp, symbol, price, quantity, iso_timestamp)
+            VALUES (?, ?, ?, ?, ?)
+        """
+        self._sql_window = """
+            INSERT INTO sampled_windows 
+            (timestamp, symbol, mean_price, std_price, min_price, max_price, total_volume, tick_count, vwap)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """
+        self._sql_metrics = """
+            INSERT INTO metrics
+            (timestamp, symbol, mean_price, std_price, volatility, z_score, sma_20, ema_20, rsi,
+             correlation_btc_eth, garch_forecast, adf_pvalue, trend)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """
+        
+        # The event loop appends and flush() pops from another thread; single
+        # deque appends/pops are atomic, so no row can land in a buffer that
+        # has already been handed off
+        self._tick_buf: Deque[tuple] = deque()
+        self._window_buf: Deque[tuple] = deque()
+        self._metrics_buf: Deque[tuple] = deque()
     
     def init_db(self) -> None:
         """Initialize database schema."""
@@ -287,49 +335,56 @@ class TickDatabase:
         logger.info(f"✅ Database initialized: {self.db_path}")
     
     def insert_tick(self, tick: Tick) -> None:
-        """Insert raw tick."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            INSERT INTO ticks (timestamp, symbol, price, quantity, iso_timestamp)
-            VALUES (?, ?, ?, ?, ?)
-        """, (tick.timestamp, tick.symbol, tick.price, tick.quantity, tick.iso_timestamp))
-        
-        conn.commit()
-        conn.close()
+        """Queue raw tick for the next flush."""
+        self._tick_buf.append((tick.timestamp, tick.symbol, tick.price, tick.quantity, tick.iso_timestamp))
     
     def insert_window(self, window: SampledWindow) -> None:
-        """Insert sampled window."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            INSERT INTO sampled_windows 
-            (timestamp, symbol, mean_price, std_price, min_price, max_price, total_volume, tick_count, vwap)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (window.timestamp, window.symbol, window.mean_price, window.std_price,
-              window.min_price, window.max_price, window.total_volume, window.tick_count, window.vwap))
-        
-        conn.commit()
-        conn.close()
+        """Queue sampled window for the next flush."""
+        self._window_buf.append((window.timestamp, window.symbol, window.mean_price, window.std_price,
+                                 window.min_price, window.max_price, window.total_volume, window.tick_count, window.vwap))
     
     def insert_metrics(self, metrics) -> None:
-        """Insert analytics metrics."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        """Queue analytics metrics for the next flush."""
+        self._metrics_buf.append((metrics.timestamp, metrics.symbol, metrics.mean_price, metrics.std_price,
+                                  metrics.volatility, metrics.z_score, metrics.sma_20, metrics.ema_20, metrics.rsi,
+                                  metrics.correlation_btc_eth, metrics.garch_forecast, metrics.adf_pvalue, metrics.trend))
+    
+    @staticmethod
+    def _drain(buf: Deque[tuple]) -> List[tuple]:
+        # Only flush() pops, so at least len(buf) rows are there to take
+        return [buf.popleft() for _ in range(len(buf))]
+    
+    def flush(self) -> None:
+        """Write all queued rows in a single transaction."""
+        ticks = self._drain(self._tick_buf)
+        windows = self._drain(self._window_buf)
+        metrics = self._drain(self._metrics_buf)
         
-        cursor.execute("""
-            INSERT INTO metrics
-            (timestamp, symbol, mean_price, std_price, volatility, z_score, sma_20, ema_20, rsi,
-             correlation_btc_eth, garch_forecast, adf_pvalue, trend)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (metrics.timestamp, metrics.symbol, metrics.mean_price, metrics.std_price,
-              metrics.volatility, metrics.z_score, metrics.sma_20, metrics.ema_20, metrics.rsi,
-              metrics.correlation_btc_eth, metrics.garch_forecast, metrics.adf_pvalue, metrics.trend))
+        if not (ticks or windows or metrics):
+            return
         
-        conn.commit()
-        conn.close()
+        cursor = self._cur
+        cursor.execute("BEGIN")
+        try:
+            if ticks:
+                cursor.executemany(self._sql_tick, ticks)
+            if windows:
+                cursor.executemany(self._sql_window, windows)
+            if metrics:
+                cursor.executemany(self._sql_metrics, metrics)
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            # Put the rows back ahead of anything queued since, for the next flush
+            self._tick_buf.extendleft(reversed(ticks))
+            self._window_buf.extendleft(reversed(windows))
+            self._metrics_buf.extendleft(reversed(metrics))
+            raise
+    
+    def close(self) -> None:
+        """Flush pending rows and close the write connection."""
+        self.flush()
+        self._conn.close()
     
     def get_recent_windows(self, symbol: str, limit: int = 100) -> List[SampledWindow]:
         """Get recent sampled windows."""
@@ -349,29 +404,37 @@ class TickDatabase:
         
         return [SampledWindow(*row) for row in rows[::-1]]
     
-    def export_to_csv(self, symbol: str, hours: int = 1) -> str:
-        """Export metrics to CSV."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cutoff = time.time() * 1000 - (hours * 3600 * 1000)
+    def export_to_csv_iter(self, symbol: str, hours: int = 1, batch_size: int = 1000) -> Iterator[str]:
+        """Export metrics to CSV, yielding the header first and then one chunk per batch of rows."""
+        yield "timestamp,symbol,mean_price,std_price,volatility,z_score,sma_20,ema_20,rsi,correlation_btc_eth,garch_forecast,adf_pvalue,trend\n"
         
-        cursor.execute("""
-            SELECT timestamp, symbol, mean_price, std_price, volatility, z_score, sma_20, ema_20, rsi,
-                   correlation_btc_eth, garch_forecast, adf_pvalue, trend
-            FROM metrics
-            WHERE symbol = ? AND timestamp > ?
-            ORDER BY timestamp ASC
-        """, (symbol, cutoff))
-        
-        rows = cursor.fetchall()
-        conn.close()
-        
-        csv_data = "timestamp,symbol,mean_price,std_price,volatility,z_score,sma_20,ema_20,rsi,correlation_btc_eth,garch_forecast,adf_pvalue,trend\n"
-        for row in rows:
-            csv_data += ",".join(str(x) if x is not None else "" for x in row) + "\n"
-        
-        return csv_data
+        conn = sqlite3.connect(self.db_path)
+        try:
+            cursor = conn.cursor()
+            cursor.arraysize = batch_size
+            
+            cutoff = time.time() * 1000 - (hours * 3600 * 1000)
+            
+            cursor.execute("""
+                SELECT timestamp, symbol, mean_price, std_price, volatility, z_score, sma_20, ema_20, rsi,
+                       correlation_btc_eth, garch_forecast, adf_pvalue, trend
+                FROM metrics
+                WHERE symbol = ? AND timestamp > ?
+                ORDER BY timestamp ASC
+            """, (symbol, cutoff))
+            
+            chunk = io.StringIO()
+            writer = csv.writer(chunk, lineterminator="\n")
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    break
+                writer.writerows(rows)
+                yield chunk.getvalue()
+                chunk.seek(0)
+                chunk.truncate()
+        finally:
+            conn.close()
     
     def cleanup_old_data(self, keep_days: int = 7) -> None:
         """Remove old data from database."""
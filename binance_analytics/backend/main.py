@@ -1,13 +1,20 @@
 """FastAPI backend for Quant Analytics Dashboard."""
 import asyncio
 import logging
+import sqlite3
 import time
 import uuid
-from typing import Dict, List, Optional
+from dataclasses import asdict
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from operator import attrgetter
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
-from fastapi import FastAPI, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi import FastAPI, HTTPException, BackgroundTasks, WebSocket
+from fastapi.responses import FileResponse, ORJSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+import orjson
 import uvicorn
 import io
 import os
@@ -16,10 +23,12 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from backend.models import (
     AnalyticsResponse, AlertRuleRequest, AlertRuleResponse, 
-    ConnectionStatusResponse, SampledWindowResponse
+    ConnectionStatusResponse, SampledWindowResponse, AlertEvent, SampledWindow
 )
 from backend.data_handler import BinanceWebSocketClient, TickBuffer, TickDatabase
-from backend.analytics import AnalyticsEngine
+from backend.analytics import AnalyticsEngine, BACKTEST_WINDOW
+from backend.broadcast import BroadcastHub, PriceDeltaEncoder
+from backend.cache import ResponseCache
 from backend import utils
 
 # Logging setup
@@ -33,7 +42,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Binance Live Quant Analytics",
     description="Real-time trading analytics with Binance WebSocket",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS
@@ -45,18 +55,48 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Configuration
+SYMBOLS = ["BTCUSDT", "ETHUSDT"]
+SAMPLING_INTERVAL = 5.0  # 5 seconds
+DB_FLUSH_INTERVAL = 1.0  # 1 second
+MAX_ALERT_HISTORY = 10000
+
 # Global state
 ws_client: Optional[BinanceWebSocketClient] = None
 tick_buffer = TickBuffer()
 db = TickDatabase()
+# SQLite writes are serialized anyway, so one worker keeps them off the event loop.
+# The loop keeps queueing rows while db.flush runs here; TickDatabase's deque
+# buffers make that hand-off safe, and the single worker means flushes never overlap.
+db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db")
+# Shared connection for alert rule persistence (one row written per mutation)
+_alerts_conn = sqlite3.connect(db.db_path, check_same_thread=False, isolation_level=None)
+_alerts_conn.execute("PRAGMA journal_mode=WAL")
+_alerts_conn.execute("PRAGMA synchronous=NORMAL")
 analytics_engine = AnalyticsEngine(window_size=60, max_history=500)
 alert_rules: Dict[str, Dict] = {}
-alert_history: List[Dict] = []
-
-# Configuration
-SYMBOLS = ["BTCUSDT", "ETHUSDT"]
-SAMPLING_INTERVAL = 5.0  # 5 seconds
-MAX_ALERT_HISTORY = 1000
+# symbol -> rule_id -> (rule, metric getter, comparator), bound once when the rule is indexed
+alert_rules_by_symbol: Dict[str, Dict[str, Tuple[Dict, Callable, Callable]]] = {}
+alert_history: Deque[AlertEvent] = deque(maxlen=MAX_ALERT_HISTORY)
+broadcast_hub = BroadcastHub()
+price_encoder = PriceDeltaEncoder()
+# Delta rows are unreadable without their baseline, so overflow re-sends baselines
+price_hub = BroadcastHub(resync=price_encoder.snapshot)
+analytics_hub = BroadcastHub()
+response_cache = ResponseCache()
+# Pre-serialized /analytics and /correlations bodies, rebuilt once per sampling cycle
+_analytics_snapshot: Optional[bytes] = None
+_correlations_snapshot: Optional[bytes] = None
+# Serialized /alerts/rules body; reset to None whenever a rule changes
+_rules_json_cache: Optional[bytes] = None
+
+# Alert metric name -> AnalyticsMetrics attribute
+_METRIC_GETTERS = {
+    "z_score": attrgetter("z_score"),
+    "volatility": attrgetter("volatility"),
+    "price": attrgetter("mean_price"),
+    "rsi": attrgetter("rsi"),
+}
 
 
 # ==============================================================================
@@ -74,18 +114,26 @@ async def websocket_task() -> None:
 
 async def on_tick_received(tick) -> None:
     """Handle incoming tick from WebSocket."""
-    tick_buffer.add(tick)
+    tick_buffer.add(tick.symbol, tick.price, tick.quantity)
     db.insert_tick(tick)
 
 
 async def sampling_task() -> None:
     """Sample buffers every 5 seconds and compute analytics."""
+    loop = asyncio.get_running_loop()
+    # Absolute deadlines so processing time and sleep jitter never accumulate
+    next_deadline = loop.time() + SAMPLING_INTERVAL
     while True:
         try:
-            await asyncio.sleep(SAMPLING_INTERVAL)
+            delay = next_deadline - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            next_deadline += SAMPLING_INTERVAL
             
-            if not tick_buffer.should_flush():
-                continue
+            # Skip whole intervals we fell behind on but stay on the same phase
+            behind = loop.time() - next_deadline
+            if behind > 0:
+                next_deadline += (behind // SAMPLING_INTERVAL + 1) * SAMPLING_INTERVAL
             
             windows = tick_buffer.flush()
             
@@ -100,68 +148,66 @@ async def sampling_task() -> None:
                 # Check alert rules
                 check_alerts(metrics)
                 
+                # Push to live stream subscribers
+                broadcast_hub.publish(asdict(metrics))
+                for message in price_encoder.encode(symbol, window.timestamp, window.mean_price, window.total_volume):
+                    price_hub.publish(message)
+                
                 logger.debug(f"✅ {symbol}: price={window.mean_price:.2f}, vol={window.total_volume:.2f}")
+            
+            # New windows make every cached analytics response stale
+            if windows:
+                response_cache.invalidate("analytics:")
+                refresh_analytics_snapshots()
         
         except Exception as e:
             logger.error(f"Sampling task error: {e}")
 
 
+async def db_flush_task() -> None:
+    """
+    Write buffered ticks, windows and metrics to the database every second.
+    
+    The flush runs on db_executor while the loop keeps queueing rows; rows of
+    a failed flush are re-queued by TickDatabase and retried on the next pass.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        try:
+            await asyncio.sleep(DB_FLUSH_INTERVAL)
+            await loop.run_in_executor(db_executor, db.flush)
+        except Exception as e:
+            logger.error(f"DB flush task error: {e}")
+
+
 async def cleanup_task() -> None:
     """Cleanup old data periodically."""
     while True:
         try:
             await asyncio.sleep(3600)  # Every hour
-            db.cleanup_old_data(keep_days=7)
+            await asyncio.to_thread(db.cleanup_old_data, keep_days=7)
         except Exception as e:
             logger.error(f"Cleanup task error: {e}")
 
 
 def check_alerts(metrics) -> None:
-    """Check if any alert rules are triggered."""
-    for rule_id, rule in alert_rules.items():
+    """Check if any alert rules for the metrics' symbol are triggered."""
+    for rule_id, (rule, getter, compare) in alert_rules_by_symbol.get(metrics.symbol, {}).items():
         if not rule["enabled"]:
             continue
         
-        symbol = rule["symbol"]
-        metric_name = rule["metric"]
-        condition = rule["condition"]
         threshold = rule["threshold"]
-        
-        # Get metric value
-        actual_value = None
-        if metric_name == "z_score":
-            actual_value = metrics.z_score
-        elif metric_name == "volatility":
-            actual_value = metrics.volatility
-        elif metric_name == "price":
-            actual_value = metrics.mean_price
-        elif metric_name == "rsi":
-            actual_value = metrics.rsi
-        
-        if actual_value is None:
-            continue
-        
-        # Check condition
-        triggered = utils.check_alert_condition(actual_value, condition, threshold)
+        actual_value = getter(metrics)
+        triggered = compare(actual_value, threshold)
         
         if triggered:
             rule["triggered_count"] += 1
+            invalidate_rules_cache()
             
-            alert_event = {
-                "rule_id": rule_id,
-                "timestamp": time.time() * 1000,
-                "symbol": symbol,
-                "metric": metric_name,
-                "actual_value": actual_value,
-                "threshold": threshold,
-            }
-            alert_history.append(alert_event)
+            alert_event = AlertEvent(rule_id, time.time() * 1000, rule["symbol"], rule["metric"], actual_value, threshold)
+            alert_history.append(alert_event)  # deque drops the oldest event once full
             
-            # Keep history size bounded
-            if len(alert_history) > MAX_ALERT_HISTORY:
-                alert_history.pop(0)
-            
-            logger.warning(f"🚨 Alert triggered: {rule_id} - {metric_name} {condition} {threshold} (actual: {actual_value:.4f})")
+            logger.warning(f"🚨 Alert triggered: {rule_id} - {rule['metric']} {rule['condition']} {threshold} (actual: {actual_value:.4f})")
 
 
 # ==============================================================================
@@ -176,18 +222,59 @@ async def startup_event():
     # Load alerts from database
     load_alerts_from_db()
     
+    # Compile JIT kernels before the first window arrives
+    warm_up_kernels()
+    
     # Start background tasks
     asyncio.create_task(websocket_task())
     asyncio.create_task(sampling_task())
+    asyncio.create_task(db_flush_task())
     asyncio.create_task(cleanup_task())
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Flush buffered rows before exit."""
+    logger.info("Flushing database buffers...")
+    await asyncio.get_running_loop().run_in_executor(db_executor, db.close)
+    db_executor.shutdown(wait=True)
+
+
 @app.get("/health", tags=["Health"])
 async def health_check():
     """Health check endpoint."""
     return {"status": "healthy", "timestamp": datetime.utcnow().isoformat()}
 
 
+@app.websocket("/ws/stream")
+async def stream_metrics(websocket: WebSocket):
+    """Stream analytics metrics; each frame is a JSON array of one or more metrics objects."""
+    await websocket.accept()
+    await broadcast_hub.serve(websocket)
+
+
+@app.websocket("/ws/analytics")
+async def stream_analytics(websocket: WebSocket):
+    """Push the /analytics body on every new window; frames are JSON arrays of snapshots, newest last."""
+    await websocket.accept()
+    snapshot = {symbol: asdict(metrics) for symbol, metrics in analytics_engine.get_all_metrics().items()}
+    await analytics_hub.serve(websocket, initial=[snapshot])
+
+
+@app.websocket("/ws/prices")
+async def stream_prices(websocket: WebSocket):
+    """
+    Stream compact window prices.
+    
+    Frames are JSON arrays. The first carries one baseline object per known
+    symbol; after that, `[symbol, dt_ms, dp, qty]` rows are integer deltas
+    from the symbol's baseline (price = (p + dp) / price_scale), with any
+    new symbol announced by its own baseline object.
+    """
+    await websocket.accept()
+    await price_hub.serve(websocket, initial=price_encoder.snapshot())
+
+
 @app.get("/status", response_model=ConnectionStatusResponse, tags=["Status"])
 async def get_status():
     """Get connection and system status."""
@@ -210,48 +297,15 @@ async def get_status():
 @app.get("/ticks/latest", response_model=List[SampledWindowResponse], tags=["Data"])
 async def get_latest_ticks(symbol: str = "BTCUSDT", limit: int = 50):
     """Get latest sampled tick windows."""
-    windows = db.get_recent_windows(symbol, limit)
-    
-    return [
-        SampledWindowResponse(
-            timestamp=w.timestamp,
-            symbol=w.symbol,
-            mean_price=w.mean_price,
-            std_price=w.std_price,
-            min_price=w.min_price,
-            max_price=w.max_price,
-            total_volume=w.total_volume,
-            tick_count=w.tick_count,
-            vwap=w.vwap,
-        )
-        for w in windows
-    ]
+    return await asyncio.to_thread(db.get_recent_windows, symbol, limit)
 
 
 @app.get("/analytics", response_model=Dict[str, AnalyticsResponse], tags=["Analytics"])
 async def get_analytics():
     """Get latest analytics for all symbols."""
-    metrics_dict = analytics_engine.get_all_metrics()
-    
-    response = {}
-    for symbol, metrics in metrics_dict.items():
-        response[symbol] = AnalyticsResponse(
-            timestamp=metrics.timestamp,
-            symbol=metrics.symbol,
-            mean_price=metrics.mean_price,
-            std_price=metrics.std_price,
-            volatility=metrics.volatility,
-            z_score=metrics.z_score,
-            sma_20=metrics.sma_20,
-            ema_20=metrics.ema_20,
-            rsi=metrics.rsi,
-            correlation_btc_eth=metrics.correlation_btc_eth,
-            garch_forecast=metrics.garch_forecast,
-            adf_pvalue=metrics.adf_pvalue,
-            trend=metrics.trend,
-        )
-    
-    return response
+    if _analytics_snapshot is None:
+        refresh_analytics_snapshots()
+    return Response(content=_analytics_snapshot, media_type="application/json")
 
 
 @app.get("/analytics/{symbol}", response_model=AnalyticsResponse, tags=["Analytics"])
@@ -262,24 +316,11 @@ async def get_symbol_analytics(symbol: str):
     if not metrics:
         raise HTTPException(status_code=404, detail=f"No metrics for {symbol}")
     
-    return AnalyticsResponse(
-        timestamp=metrics.timestamp,
-        symbol=metrics.symbol,
-        mean_price=metrics.mean_price,
-        std_price=metrics.std_price,
-        volatility=metrics.volatility,
-        z_score=metrics.z_score,
-        sma_20=metrics.sma_20,
-        ema_20=metrics.ema_20,
-        rsi=metrics.rsi,
-        correlation_btc_eth=metrics.correlation_btc_eth,
-        garch_forecast=metrics.garch_forecast,
-        adf_pvalue=metrics.adf_pvalue,
-        trend=metrics.trend,
-    )
+    return metrics
 
 
 @app.get("/price-history/{symbol}", tags=["Analytics"])
+@response_cache.cached("analytics:price-history", expire=SAMPLING_INTERVAL)
 async def get_price_history(symbol: str, limit: int = 100):
     """Get price history for symbol."""
     history = analytics_engine.get_price_history(symbol.upper(), limit)
@@ -294,15 +335,13 @@ async def get_price_history(symbol: str, limit: int = 100):
 @app.get("/correlations", tags=["Analytics"])
 async def get_correlations():
     """Get correlation matrix between symbols."""
-    corr_matrix = analytics_engine.get_correlation_matrix()
-    
-    return {
-        "timestamp": datetime.utcnow().isoformat(),
-        "correlations": corr_matrix
-    }
+    if _correlations_snapshot is None:
+        refresh_analytics_snapshots()
+    return Response(content=_correlations_snapshot, media_type="application/json")
 
 
 @app.get("/clustering", tags=["Analytics"])
+@response_cache.cached("analytics:clustering", expire=SAMPLING_INTERVAL)
 async def get_clustering():
     """Cluster symbols by correlation."""
     clusters = analytics_engine.cluster_by_correlation(min_correlation=0.7)
@@ -325,6 +364,22 @@ async def backtest_symbol(symbol: str):
     }
 
 
+@app.get("/dashboard/{symbol}", tags=["Analytics"])
+async def get_dashboard(symbol: str, limit: int = 100):
+    """Everything the dashboard's analysis tabs render, in one round-trip."""
+    symbol = symbol.upper()
+    ticks = await asyncio.to_thread(db.get_recent_windows, symbol, limit)
+    clustering = await get_clustering()
+    
+    return {
+        "symbol": symbol,
+        "analytics": analytics_engine.get_metrics(symbol),
+        "ticks": ticks,
+        "correlations": analytics_engine.get_correlation_matrix(),
+        "clusters": clustering["clusters"],
+    }
+
+
 # ==============================================================================
 # ALERT ENDPOINTS
 # ==============================================================================
@@ -345,17 +400,22 @@ async def create_alert_rule(request: AlertRuleRequest):
     }
     
     alert_rules[rule_id] = rule
-    save_alerts_to_db()
+    index_alert_rule(rule)
+    await asyncio.to_thread(save_alert_to_db, rule_id)
     
     logger.info(f"✅ Alert rule created: {rule_id}")
     
-    return AlertRuleResponse(**rule)
+    return rule
 
 
 @app.get("/alerts/rules", response_model=List[AlertRuleResponse], tags=["Alerts"])
 async def list_alert_rules():
     """List all alert rules."""
-    return [AlertRuleResponse(**rule) for rule in alert_rules.values()]
+    global _rules_json_cache
+    
+    if _rules_json_cache is None:
+        _rules_json_cache = orjson.dumps(list(alert_rules.values()))
+    return Response(content=_rules_json_cache, media_type="application/json")
 
 
 @app.put("/alerts/rules/{rule_id}", response_model=AlertRuleResponse, tags=["Alerts"])
@@ -364,6 +424,7 @@ async def update_alert_rule(rule_id: str, request: AlertRuleRequest):
     if rule_id not in alert_rules:
         raise HTTPException(status_code=404, detail="Rule not found")
     
+    unindex_alert_rule(alert_rules[rule_id])
     alert_rules[rule_id].update({
         "symbol": request.symbol,
         "metric": request.metric,
@@ -371,10 +432,11 @@ async def update_alert_rule(rule_id: str, request: AlertRuleRequest):
         "threshold": request.threshold,
         "enabled": request.enabled,
     })
+    index_alert_rule(alert_rules[rule_id])
     
-    save_alerts_to_db()
+    await asyncio.to_thread(save_alert_to_db, rule_id)
     
-    return AlertRuleResponse(**alert_rules[rule_id])
+    return alert_rules[rule_id]
 
 
 @app.delete("/alerts/rules/{rule_id}", tags=["Alerts"])
@@ -383,8 +445,8 @@ async def delete_alert_rule(rule_id: str):
     if rule_id not in alert_rules:
         raise HTTPException(status_code=404, detail="Rule not found")
     
-    del alert_rules[rule_id]
-    save_alerts_to_db()
+    unindex_alert_rule(alert_rules.pop(rule_id))
+    await asyncio.to_thread(delete_alert_from_db, rule_id)
     
     return {"message": "Alert rule deleted"}
 
@@ -395,7 +457,7 @@ async def get_alert_history(limit: int = 100):
     return {
         "timestamp": datetime.utcnow().isoformat(),
         "count": len(alert_history),
-        "alerts": alert_history[-limit:]
+        "alerts": [event._asdict() for event in islice(alert_history, max(0, len(alert_history) - limit), None)]
     }
 
 
@@ -406,12 +468,11 @@ async def get_alert_history(limit: int = 100):
 @app.get("/export/csv", tags=["Export"])
 async def export_csv(symbol: str = "BTCUSDT", hours: int = 1):
     """Export analytics as CSV."""
-    csv_data = db.export_to_csv(symbol.upper(), hours)
-    
     filename = f"{symbol}_analytics_{datetime.utcnow().isoformat()}.csv"
     
+    # Starlette iterates sync generators in its threadpool, so the query never runs on the event loop
     return StreamingResponse(
-        iter([csv_data]),
+        db.export_to_csv_iter(symbol.upper(), hours),
         media_type="text/csv",
         headers={"Content-Disposition": f"attachment; filename={filename}"}
     )
@@ -421,47 +482,91 @@ async def export_csv(symbol: str = "BTCUSDT", hours: int = 1):
 # HELPER FUNCTIONS
 # ==============================================================================
 
-def save_alerts_to_db() -> None:
-    """Save alerts to database."""
+def refresh_analytics_snapshots() -> None:
+    """Serialize the /analytics and /correlations bodies from the latest metrics."""
+    global _analytics_snapshot, _correlations_snapshot
+    
+    _analytics_snapshot = orjson.dumps(analytics_engine.get_all_metrics())
+    if analytics_hub.clients:
+        analytics_hub.publish_raw(_analytics_snapshot.decode())
+    _correlations_snapshot = orjson.dumps({
+        "timestamp": datetime.utcnow().isoformat(),
+        "correlations": analytics_engine.get_correlation_matrix()
+    })
+
+
+def warm_up_kernels() -> None:
+    """Run every JIT kernel once on scratch data so compilation happens at startup."""
+    scratch_engine = AnalyticsEngine()
+    for i in range(BACKTEST_WINDOW + 1):
+        price = 1.0 + i % 2
+        scratch_engine.process_window(SampledWindow(float(i), "WARMUP", price, 0.0, price, price, 1.0, 1, price))
+    scratch_engine.backtest_mean_reversion("WARMUP")
+
+
+def invalidate_rules_cache() -> None:
+    """Force /alerts/rules to re-serialize on its next request."""
+    global _rules_json_cache
+    _rules_json_cache = None
+
+
+def index_alert_rule(rule: Dict) -> None:
+    """Register a rule in the per-symbol index used by check_alerts."""
+    getter = _METRIC_GETTERS.get(rule["metric"])
+    compare = utils.ALERT_COMPARATORS.get(rule["condition"])
+    # Rules on unknown metrics or conditions can never trigger, so they are not indexed
+    if getter is not None and compare is not None:
+        alert_rules_by_symbol.setdefault(rule["symbol"].upper(), {})[rule["rule_id"]] = (rule, getter, compare)
+    invalidate_rules_cache()
+
+
+def unindex_alert_rule(rule: Dict) -> None:
+    """Remove a rule from the per-symbol index."""
+    alert_rules_by_symbol.get(rule["symbol"].upper(), {}).pop(rule["rule_id"], None)
+    invalidate_rules_cache()
+
+
+def save_alert_to_db(rule_id: str) -> None:
+    """Insert or update a single alert rule in the database."""
     try:
-        import sqlite3
-        conn = sqlite3.connect("data/ticks.db")
-        cursor = conn.cursor()
-        
-        cursor.execute("DELETE FROM alerts")
-        
-        for rule_id, rule in alert_rules.items():
-            cursor.execute("""
-                INSERT INTO alerts 
-                (rule_id, symbol, metric, condition, threshold, enabled, triggered_count, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                rule["rule_id"],
-                rule["symbol"],
-                rule["metric"],
-                rule["condition"],
-                rule["threshold"],
-                rule["enabled"],
-                rule["triggered_count"],
-                time.time() * 1000
-            ))
-        
-        conn.commit()
-        conn.close()
+        rule = alert_rules[rule_id]
+        _alerts_conn.execute("""
+            INSERT INTO alerts 
+            (rule_id, symbol, metric, condition, threshold, enabled, triggered_count, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(rule_id) DO UPDATE SET
+                symbol = excluded.symbol,
+                metric = excluded.metric,
+                condition = excluded.condition,
+                threshold = excluded.threshold,
+                enabled = excluded.enabled,
+                triggered_count = excluded.triggered_count
+        """, (
+            rule["rule_id"],
+            rule["symbol"],
+            rule["metric"],
+            rule["condition"],
+            rule["threshold"],
+            rule["enabled"],
+            rule["triggered_count"],
+            time.time() * 1000
+        ))
     except Exception as e:
-        logger.error(f"Failed to save alerts: {e}")
+        logger.error(f"Failed to save alert {rule_id}: {e}")
+
+
+def delete_alert_from_db(rule_id: str) -> None:
+    """Delete a single alert rule from the database."""
+    try:
+        _alerts_conn.execute("DELETE FROM alerts WHERE rule_id = ?", (rule_id,))
+    except Exception as e:
+        logger.error(f"Failed to delete alert {rule_id}: {e}")
 
 
 def load_alerts_from_db() -> None:
     """Load alerts from database."""
     try:
-        import sqlite3
-        conn = sqlite3.connect("data/ticks.db")
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT * FROM alerts")
-        rows = cursor.fetchall()
-        conn.close()
+        rows = _alerts_conn.execute("SELECT * FROM alerts").fetchall()
         
         for row in rows:
             rule_id, symbol, metric, condition, threshold, enabled, triggered_count, _ = row[1:]
@@ -474,6 +579,7 @@ def load_alerts_from_db() -> None:
                 "enabled": bool(enabled),
                 "triggered_count": triggered_count,
             }
+            index_alert_rule(alert_rules[rule_id])
         
         logger.info(f"Loaded {len(alert_rules)} alert rules from database")
     except Exception as e:
@@ -493,5 +599,8 @@ if __name__ == "__main__":
         app,
         host="0.0.0.0",
         port=8000,
+        loop="auto",  # uvloop when installed
+        http="auto",  # httptools when installed
+        access_log=False,
         log_level="info"
     )
@@ -1,11 +1,15 @@
 """Data models and Pydantic schemas for the Quant Analytics system."""
+import sys
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List, NamedTuple, Optional
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
+# Slotted dataclasses (no per-instance __dict__) where the interpreter supports them
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Tick:
     """Raw tick from Binance WebSocket."""
     timestamp: float
@@ -18,7 +22,7 @@ class Tick:
         return datetime.fromtimestamp(self.timestamp / 1000).isoformat()
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SampledWindow:
     """5-second aggregated data window."""
     timestamp: float
@@ -32,7 +36,7 @@ class SampledWindow:
     vwap: float
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AnalyticsMetrics:
     """Computed analytics for a symbol."""
     timestamp: float
@@ -50,6 +54,16 @@ class AnalyticsMetrics:
     trend: str = "neutral"
 
 
+class AlertEvent(NamedTuple):
+    """Triggered alert recorded in the alert history."""
+    rule_id: str
+    timestamp: float
+    symbol: str
+    metric: str
+    actual_value: float
+    threshold: float
+
+
 class TickResponse(BaseModel):
     timestamp: float
     symbol: str
@@ -59,6 +73,8 @@ class TickResponse(BaseModel):
 
 
 class SampledWindowResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    
     timestamp: float
     symbol: str
     mean_price: float
@@ -71,6 +87,8 @@ class SampledWindowResponse(BaseModel):
 
 
 class AnalyticsResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    
     timestamp: float
     symbol: str
     mean_price: float
@@ -95,6 +113,8 @@ class AlertRuleRequest(BaseModel):
 
 
 class AlertRuleResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    
     rule_id: str
     symbol: str
     metric: str
@@ -1,66 +1,73 @@
 """Utility functions for analytics calculations."""
 import math
-from typing import List, Optional
-from collections import deque
+import operator
+import random
+from typing import Callable, Dict, Optional
 import numpy as np
 
+from backend._njit import njit
 
-def calculate_mean(values: List[float]) -> float:
-    """Calculate arithmetic mean."""
-    return sum(values) / len(values) if values else 0.0
 
-
-def calculate_std(values: List[float], mean: Optional[float] = None) -> float:
-    """Calculate standard deviation."""
-    if not values or len(values) < 2:
-        return 0.0
-    m = mean or calculate_mean(values)
-    variance = sum((x - m) ** 2 for x in values) / len(values)
-    return math.sqrt(variance)
-
-
-def calculate_vwap(prices: List[float], volumes: List[float]) -> float:
-    """Calculate Volume Weighted Average Price."""
-    if not prices or not volumes or len(prices) != len(volumes):
-        return 0.0
-    num = sum(p * v for p, v in zip(prices, volumes))
-    denom = sum(volumes)
-    return num / denom if denom > 0 else 0.0
-
-
-def calculate_sma(values: List[float], period: int = 20) -> float:
-    """Calculate Simple Moving Average."""
-    if len(values) < period:
-        return calculate_mean(values)
-    return calculate_mean(values[-period:])
-
-
-def calculate_ema(values: List[float], period: int = 20) -> float:
-    """Calculate Exponential Moving Average."""
-    if not values:
-        return 0.0
-    if len(values) < period:
-        return calculate_mean(values)
+class RingBuffer:
+    """
+    Fixed-capacity float64 ring buffer backed by a NumPy array.
     
-    k = 2.0 / (period + 1)
-    ema = values[0]
-    for val in values[1:]:
-        ema = val * k + ema * (1 - k)
-    return ema
+    Each value is written twice, at `pos` and `pos + capacity`, so the
+    retained values always form one contiguous slice and view() never copies.
+    """
+    
+    def __init__(self, capacity: int):
+        self.buf = np.zeros(2 * capacity, dtype=np.float64)
+        self.maxlen = capacity
+        self.size = 0
+        self.idx = 0
+    
+    def append(self, value: float) -> Optional[float]:
+        """Append a value, returning the evicted one once the buffer is full."""
+        pos = self.idx % self.maxlen
+        evicted = float(self.buf[pos]) if self.size == self.maxlen else None
+        self.buf[pos] = value
+        self.buf[pos + self.maxlen] = value
+        self.idx += 1
+        if self.size < self.maxlen:
+            self.size += 1
+        return evicted
+    
+    def view(self) -> np.ndarray:
+        """Return values oldest-first as a zero-copy view (valid until the next append)."""
+        end = self.idx % self.maxlen + self.maxlen
+        return self.buf[end - self.size:end]
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def __getitem__(self, i: int) -> float:
+        if i < 0:
+            i += self.size
+        if not 0 <= i < self.size:
+            raise IndexError("RingBuffer index out of range")
+        return float(self.buf[(self.idx - self.size + i) % self.maxlen])
+    
+    def __iter__(self):
+        return iter(self.view().tolist())
+
+
+def _as_array(values) -> np.ndarray:
+    """Convert a sequence to a contiguous float64 array (no copy for float64 arrays)."""
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def calculate_std_from_sums(total: float, total_sq: float, n: int) -> float:
+    """Calculate standard deviation from running sum and sum of squares."""
+    if n < 2:
+        return 0.0
+    mean = total / n
+    variance = total_sq / n - mean * mean
+    return math.sqrt(variance) if variance > 0 else 0.0
 
 
-def calculate_rsi(values: List[float], period: int = 14) -> float:
-    """Calculate Relative Strength Index."""
-    if len(values) < period + 1:
-        return 50.0
-    
-    changes = [values[i] - values[i-1] for i in range(1, len(values))]
-    gains = [max(c, 0) for c in changes[-period:]]
-    losses = [abs(min(c, 0)) for c in changes[-period:]]
-    
-    avg_gain = sum(gains) / period
-    avg_loss = sum(losses) / period
-    
+def calculate_rsi_from_averages(avg_gain: float, avg_loss: float) -> float:
+    """Calculate RSI from average gain and average loss."""
     if avg_loss == 0:
         return 100.0 if avg_gain > 0 else 50.0
     
@@ -76,23 +83,22 @@ def calculate_z_score(value: float, mean: float, std: float) -> float:
     return (value - mean) / std
 
 
-def calculate_correlation(x: List[float], y: List[float]) -> Optional[float]:
+def calculate_correlation(x: np.ndarray, y: np.ndarray) -> Optional[float]:
     """Calculate Pearson correlation coefficient."""
     if len(x) < 2 or len(y) < 2 or len(x) != len(y):
         return None
     
-    x_mean = calculate_mean(x)
-    y_mean = calculate_mean(y)
-    
-    numerator = sum((xi - x_mean) * (yi - y_mean) for xi, yi in zip(x, y))
-    x_std = calculate_std(x, x_mean)
-    y_std = calculate_std(y, y_mean)
-    
-    if x_std == 0 or y_std == 0:
+    # Centre once and reuse the deviations for both variances and the covariance
+    dx = _as_array(x)
+    dx = dx - dx.mean()
+    dy = _as_array(y)
+    dy = dy - dy.mean()
+    sxx = np.dot(dx, dx)
+    syy = np.dot(dy, dy)
+    if sxx == 0 or syy == 0:
         return None
     
-    denominator = len(x) * x_std * y_std
-    return numerator / denominator if denominator != 0 else None
+    return float(np.dot(dx, dy) / math.sqrt(sxx * syy))
 
 
 def detect_trend(sma: float, ema: float, current_price: float) -> str:
@@ -105,24 +111,23 @@ def detect_trend(sma: float, ema: float, current_price: float) -> str:
         return "neutral"
 
 
+ALERT_COMPARATORS: Dict[str, Callable[[float, float], bool]] = {
+    ">": operator.gt,
+    "<": operator.lt,
+    ">=": operator.ge,
+    "<=": operator.le,
+    "==": lambda value, threshold: abs(value - threshold) < 1e-6,
+    "!=": lambda value, threshold: abs(value - threshold) >= 1e-6,
+}
+
+
 def check_alert_condition(value: float, condition: str, threshold: float) -> bool:
     """Check if alert condition is met."""
-    if condition == ">":
-        return value > threshold
-    elif condition == "<":
-        return value < threshold
-    elif condition == ">=":
-        return value >= threshold
-    elif condition == "<=":
-        return value <= threshold
-    elif condition == "==":
-        return abs(value - threshold) < 1e-6
-    elif condition == "!=":
-        return abs(value - threshold) >= 1e-6
-    return False
-
-
-def calculate_adf_test_simple(values: List[float]) -> Optional[float]:
+    compare = ALERT_COMPARATORS.get(condition)
+    return compare(value, threshold) if compare is not None else False
+
+
+def calculate_adf_test_simple(values: np.ndarray) -> Optional[float]:
     """
     Simplified ADF test p-value calculation.
     Returns approximation: lower = more stationary.
@@ -130,20 +135,21 @@ def calculate_adf_test_simple(values: List[float]) -> Optional[float]:
     if len(values) < 10:
         return None
     
+    arr = _as_array(values)
+    dev = arr - arr.mean()
+    
     # Simple approach: if autocorr is high, it's non-stationary
-    mean = calculate_mean(values)
-    autocov = sum((values[i] - mean) * (values[i-1] - mean) for i in range(1, len(values))) / len(values)
-    var = sum((v - mean) ** 2 for v in values) / len(values)
+    autocov = np.dot(dev[1:], dev[:-1]) / arr.size
+    var = np.dot(dev, dev) / arr.size
     
     if var == 0:
         return 1.0
     
     autocorr = autocov / var
-    p_value = 1.0 / (1.0 + abs(autocorr))  # Heuristic
-    return p_value
+    return float(1.0 / (1.0 + abs(autocorr)))  # Heuristic
 
 
-def calculate_garch_volatility_forecast(returns: List[float], horizon: int = 1) -> Optional[float]:
+def calculate_garch_volatility_forecast(returns: np.ndarray, horizon: int = 1) -> Optional[float]:
     """
     Simplified GARCH(1,1) volatility forecast.
     Real implementation would use statsmodels.
@@ -152,21 +158,33 @@ def calculate_garch_volatility_forecast(returns: List[float], horizon: int = 1)
         return None
     
     # Simple approximation: exponential weighted variance
-    alpha = 0.1
-    beta = 0.85
+    return float(_garch_impl(_as_array(returns), 0.1, 0.85))
+
+
+@njit("float64(float64[::1], float64, float64)", cache=True)
+def _garch_impl(returns: np.ndarray, alpha: float, beta: float) -> float:
+    """One-step GARCH(1,1) volatility forecast."""
+    n = returns.shape[0]
+    mean = 0.0
+    for i in range(n):
+        mean += returns[i]
+    mean /= n
     
-    current_return = returns[-1]
-    current_vol_sq = calculate_std(returns) ** 2
+    # Sample variance serves as both the current and the long-term variance
+    var = 0.0
+    for i in range(n):
+        dev = returns[i] - mean
+        var += dev * dev
+    var /= n
     
     # GARCH(1,1): sigma_t^2 = omega + alpha*epsilon_{t-1}^2 + beta*sigma_{t-1}^2
-    long_term_var = np.var(returns) if returns else current_vol_sq
-    omega = (1 - alpha - beta) * long_term_var
-    
-    forecast_vol_sq = omega + alpha * (current_return ** 2) + beta * current_vol_sq
+    current_return = returns[n - 1]
+    omega = (1 - alpha - beta) * var
+    forecast_vol_sq = omega + alpha * (current_return ** 2) + beta * var
     return math.sqrt(max(forecast_vol_sq, 0.0))
 
 
 def exponential_backoff(attempt: int, base: float = 1.0, max_wait: float = 60.0) -> float:
     """Calculate exponential backoff time."""
-    wait = min(base * (2 ** attempt), max_wait)
-    return wait + np.random.uniform(0, 1)  # Add jitter
+    wait = min(base * (1 << attempt), max_wait)
+    return wait + random.random()  # Add jitter
@@ -1,17 +1,21 @@
 """Streamlit dashboard for Binance Live Quant Analytics."""
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
+import numpy as np
 import time
 from datetime import datetime, timedelta
 import plotly.graph_objects as go
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 import logging
 import os 
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from frontend.components import charts, controls, alerts
+from frontend.live_feed import AnalyticsFeed
 
 # Logging
 logging.basicConfig(level=logging.INFO)
@@ -42,12 +46,60 @@ if "rules_cache" not in st.session_state:
 # API configuration
 API_BASE_URL = "http://localhost:8000"
 
-def get_api_data(endpoint: str, params: Dict = None) -> Optional[Dict]:
-    """Fetch data from backend API."""
+
+@st.cache_resource
+def get_analytics_feed() -> AnalyticsFeed:
+    """Start one analytics push subscription shared by all sessions."""
+    feed = AnalyticsFeed(API_BASE_URL.replace("http", "ws", 1) + "/ws/analytics")
+    feed.start()
+    return feed
+
+
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """Keep-alive HTTP session shared by all reruns and actions."""
+    session = requests.Session()
+    # Retry idempotent requests briefly, e.g. across a backend restart
+    retry = Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504))
+    session.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry))
+    return session
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _get_json(endpoint: str, params: Optional[Tuple] = None, tick: Optional[int] = None) -> Dict:
+    """GET an endpoint, memoized per (endpoint, params, tick) for at most one sampling interval."""
+    response = get_http_session().get(f"{API_BASE_URL}{endpoint}", params=params, timeout=5)
+    response.raise_for_status()
+    return response.json()
+
+
+def get_api_data(endpoint: str, params: Dict = None, max_age: Optional[float] = None) -> Optional[Dict]:
+    """
+    Fetch data from backend API.
+    
+    `max_age` (seconds) caps how old a cached response may be, for panels
+    polling faster than the cache TTL. Callers passing the same `max_age`
+    within one tick of that length share a single request.
+    """
+    tick = int(time.time() // max_age) if max_age else None
     try:
-        response = requests.get(f"{API_BASE_URL}{endpoint}", params=params, timeout=5)
-        response.raise_for_status()
-        return response.json()
+        # Failures raise out of _get_json, so they are never cached
+        return _get_json(endpoint, tuple(sorted(params.items())) if params else None, tick)
+    except Exception as e:
+        logger.error(f"API error: {e}")
+        return None
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _get_backtest(symbol: str) -> Dict:
+    """Backtest over the last window, memoized per symbol for a minute."""
+    return _get_json(f"/backtest/{symbol}")
+
+
+def get_backtest(symbol: str) -> Optional[Dict]:
+    """Run (or reuse a recent) mean-reversion backtest for a symbol."""
+    try:
+        return _get_backtest(symbol)
     except Exception as e:
         logger.error(f"API error: {e}")
         return None
@@ -56,7 +108,7 @@ def get_api_data(endpoint: str, params: Dict = None) -> Optional[Dict]:
 def post_api_data(endpoint: str, data: Dict) -> Optional[Dict]:
     """Post data to backend API."""
     try:
-        response = requests.post(f"{API_BASE_URL}{endpoint}", json=data, timeout=5)
+        response = get_http_session().post(f"{API_BASE_URL}{endpoint}", json=data, timeout=5)
         response.raise_for_status()
         return response.json()
     except Exception as e:
@@ -67,7 +119,7 @@ def post_api_data(endpoint: str, data: Dict) -> Optional[Dict]:
 def delete_api_data(endpoint: str) -> bool:
     """Delete via API."""
     try:
-        response = requests.delete(f"{API_BASE_URL}{endpoint}", timeout=5)
+        response = get_http_session().delete(f"{API_BASE_URL}{endpoint}", timeout=5)
         response.raise_for_status()
         return True
     except Exception as e:
@@ -75,6 +127,302 @@ def delete_api_data(endpoint: str) -> bool:
         return False
 
 
+# ==============================================================================
+# DASHBOARD TABS
+# ==============================================================================
+
+@st.cache_data(ttl=30, show_spinner=False)
+def cached_correlation_heatmap(corr_key: Tuple[Tuple[str, Optional[float]], ...]) -> Dict:
+    """Heatmap figure dict, rebuilt only when the correlation values change."""
+    return charts.create_correlation_heatmap(dict(corr_key)).to_dict()
+
+
+def render_tab_refresh(key: str) -> None:
+    """Refetch a tab's data on demand; only the enclosing fragment reruns."""
+    if st.button("🔄 Refresh", key=key):
+        _get_json.clear()
+
+
+def get_dashboard(symbol: str, max_age: Optional[float] = None) -> Dict:
+    """Analytics, latest ticks, correlations and clusters for a symbol in one request."""
+    bundle = get_api_data(f"/dashboard/{symbol}", {"limit": 100}, max_age) or {}
+    
+    # Metrics pushed over the feed are at least as fresh as the bundle's
+    analytics = get_analytics_feed().get(symbol)
+    if analytics is not None:
+        bundle = {**bundle, "analytics": analytics}
+    return bundle
+
+
+def render_price_analysis(symbol: str, refresh_rate: int):
+    """Tab 1: live price, RSI, Z-score, volatility and moving-average charts."""
+    bundle = get_dashboard(symbol, refresh_rate)
+    analytics = bundle.get("analytics")
+    ticks = bundle.get("ticks")
+    
+    st.subheader(f"💹 {symbol} Price Analysis")
+    
+    # Nothing sampled yet: skip the chart work entirely
+    if not (analytics or ticks):
+        st.info("⏳ Waiting for the first sampled windows...")
+        return
+    
+    # Metrics
+    if analytics:
+        controls.render_metrics_cards(analytics)
+        st.divider()
+        controls.render_moving_averages_metrics(analytics)
+    
+    st.divider()
+    
+    # Charts
+    col1, col2 = st.columns(2)
+    
+    # Vectorized tick -> chart series conversion (local wall-clock labels)
+    if ticks:
+        ticks_df = pd.DataFrame(ticks)
+        timestamps = (
+            pd.to_datetime(ticks_df["timestamp"], unit="ms", utc=True)
+            .dt.tz_convert(controls.local_tz())
+            .dt.strftime("%H:%M:%S")
+            .to_numpy()
+        )
+        prices = ticks_df["mean_price"].to_numpy(charts.PRICE_DTYPE)
+    else:
+        timestamps, prices = np.empty(0, dtype=object), np.empty(0)
+    
+    with col1:
+        # Price chart
+        if len(prices) > 0:
+            # Reuse the last figure until a new window arrives
+            price_sig = (symbol, ticks[-1]["timestamp"], len(ticks))
+            if st.session_state.get("price_sig") != price_sig:
+                st.session_state.price_fig = charts.create_price_chart(prices, timestamps, symbol)
+                st.session_state.price_sig = price_sig
+            st.plotly_chart(st.session_state.price_fig, use_container_width=True, key="price_chart")
+    
+    with col2:
+        # RSI chart
+        if analytics and len(prices) > 0:
+            fig = charts.create_rsi_chart(analytics.get("rsi", 50), timestamps)
+            st.plotly_chart(fig, use_container_width=True)
+    
+    st.divider()
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Z-Score chart
+        if analytics and ticks:
+            fig = charts.create_zscore_chart(analytics.get("z_score", 0), timestamps, prices)
+            st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        # Volatility chart
+        if analytics and ticks:
+            fig = charts.create_volatility_chart(analytics.get("volatility", 0), timestamps)
+            st.plotly_chart(fig, use_container_width=True)
+    
+    st.divider()
+    
+    # Moving averages
+    if analytics and ticks:
+        fig = charts.create_moving_averages_chart(prices, analytics.get("sma_20", 0), analytics.get("ema_20", 0), timestamps)
+        st.plotly_chart(fig, use_container_width=True, key="ma_chart")
+
+
+def render_live_status(refresh_rate: int):
+    """Connection status bar; polls on its own as a fragment."""
+    status = get_api_data("/status", max_age=refresh_rate)
+    if status:
+        controls.render_status_bar(status)
+
+
+def render_live_advanced_metrics(symbol: str, refresh_rate: int):
+    """Tab 2 metric panel; polls on its own as a fragment inside the tab."""
+    analytics = get_dashboard(symbol, refresh_rate).get("analytics")
+    if analytics:
+        controls.render_advanced_metrics(analytics)
+
+
+@st.fragment
+def render_advanced_analytics(symbol: str, refresh_rate: int):
+    """Tab 2: statistical metrics, correlations, clustering and price history."""
+    render_tab_refresh("refresh_advanced")
+    bundle = get_dashboard(symbol, refresh_rate)
+    
+    st.subheader("🔬 Advanced Analytics")
+    
+    # No metrics means no price history either, so don't ask for it
+    if not bundle.get("analytics"):
+        st.info("⏳ Waiting for the first sampled windows...")
+        return
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.write("### Statistical Metrics")
+        st.fragment(render_live_advanced_metrics, run_every=timedelta(seconds=refresh_rate))(symbol, refresh_rate)
+    
+    with col2:
+        st.write("### Correlation Matrix")
+        correlations = bundle.get("correlations")
+        if correlations is not None:
+            fig = cached_correlation_heatmap(tuple(sorted(correlations.items())))
+            st.plotly_chart(fig, use_container_width=True)
+    
+    st.divider()
+    
+    # Clustering
+    st.write("### Symbol Clustering")
+    clusters = bundle.get("clusters")
+    if clusters:
+        for i, cluster in enumerate(clusters):
+            st.info(f"**Cluster {i+1}:** {', '.join(cluster)}")
+    
+    st.divider()
+    
+    # Price history
+    st.write("### Price History")
+    history = get_api_data(f"/price-history/{symbol}", {"limit": 50})
+    if history and history.get("prices"):
+        st.line_chart(pd.Series(history["prices"], name="Price"), use_container_width=True)
+
+
+@st.fragment
+def render_alerts_tab():
+    """Tab 3: alert rules and triggered alert history."""
+    render_tab_refresh("refresh_alerts")
+    
+    st.subheader("🚨 Alert Management")
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        alerts.render_alert_manager()
+    
+    with col2:
+        alerts.render_notification_sound_control()
+    
+    st.divider()
+    
+    # Alert rules
+    rules_response = get_api_data("/alerts/rules")
+    if rules_response:
+        alerts.render_alert_rules(rules_response)
+    
+    st.divider()
+    
+    # Alert history
+    history_response = get_api_data("/alerts/history")
+    if history_response:
+        alert_list = history_response.get("alerts", [])
+        if alert_list:
+            alerts_df = alerts.alerts_frame(alert_list)
+            alerts.render_alert_history(alerts_df)
+            alerts.render_alert_statistics(alerts_df)
+        else:
+            st.info("No alerts triggered yet.")
+
+
+@st.fragment
+def render_backtest_tab():
+    """Tab 4: on-demand mean-reversion backtest."""
+    st.subheader("📊 Mean-Reversion Backtest")
+    
+    col1, col2 = st.columns([1, 3])
+    
+    with col1:
+        # Changing the symbol doesn't rerun anything until the form is submitted
+        with st.form("backtest_form", border=False):
+            backtest_symbol = st.selectbox(
+                "Select Symbol",
+                controls.SYMBOLS,
+                index=controls.dashboard_symbol_index()
+            )
+            submitted = st.form_submit_button("▶️ Run Backtest", use_container_width=True)
+        
+        if submitted:
+            with st.spinner("Running backtest..."):
+                result = get_backtest(backtest_symbol)
+                if result:
+                    st.success("Backtest completed!")
+                    
+                    controls.render_stat_row({
+                        "Total Trades": f"{result.get('trades', 0)}",
+                        "Win Rate": f"{result.get('win_rate', 0)*100:.1f}%",
+                        "Total PnL": f"${result.get('total_pnl', 0):.2f}",
+                    })
+                    controls.render_stat_row({
+                        "Wins": f"{result.get('wins', 0)}",
+                        "Losses": f"{result.get('losses', 0)}",
+                        "Avg PnL per Trade": f"${result.get('avg_pnl', 0):.2f}",
+                    })
+    
+    with col2:
+        st.info("""
+        ### Mean-Reversion Strategy
+        - **Entry Signal**: Z-Score > 2.0 (SHORT) or Z-Score < -2.0 (LONG)
+        - **Exit Signal**: Z-Score = 0 (mean)
+        - **Backtest Window**: Last 60 sampling periods (5 minutes)
+        
+        ### Key Metrics
+        - **Win Rate**: % of profitable trades
+        - **Total PnL**: Sum of all trade profits/losses
+        - **Avg PnL**: Average profit/loss per trade
+        """)
+
+
+@st.fragment
+def render_settings_tab(status: Dict):
+    """Tab 5: data export and dashboard info."""
+    st.subheader("⚙️ Dashboard Settings")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.write("### Data Export")
+        export_symbol = st.selectbox("Export Symbol", controls.SYMBOLS, index=controls.dashboard_symbol_index())
+        export_hours = st.slider("Export Period (hours)", 1, 24, 1)
+        
+        if st.button("📥 Export to CSV", use_container_width=True):
+            try:
+                # Exports can be tens of MB: keep the raw bytes, skip the text decode
+                response = get_http_session().get(
+                    f"{API_BASE_URL}/export/csv",
+                    params={"symbol": export_symbol, "hours": export_hours},
+                    timeout=60
+                )
+                if response.status_code == 200:
+                    st.download_button(
+                        label="⬇️ Download CSV",
+                        data=response.content,
+                        file_name=f"{export_symbol}_analytics_{datetime.now().isoformat()}.csv",
+                        mime="text/csv"
+                    )
+                    st.success("Export ready!")
+            except Exception as e:
+                st.error(f"Export failed: {e}")
+    
+    with col2:
+        st.write("### API Information")
+        st.info(f"""
+        **Backend URL:** {API_BASE_URL}
+        **Status:** {'🟢 Connected' if status else '🔴 Disconnected'}
+        **API Version:** v1.0
+        """)
+    
+    st.divider()
+    
+    st.write("### Dashboard Info")
+    st.markdown("""
+    - **Real-time Data:** Updated every 5 seconds
+    - **Data Source:** Binance Futures WebSocket
+    - **Database:** SQLite (data/ticks.db)
+    - **Analytics Engine:** Python (pandas, statsmodels, scikit-learn)
+    """)
+
+
 # ==============================================================================
 # MAIN DASHBOARD
 # ==============================================================================
@@ -88,14 +436,22 @@ def main():
     # Top controls
     symbol, refresh_rate, z_threshold = controls.render_top_controls()
     
+    # Responses are cached for a few seconds; let users force a refetch
+    if st.button("🔄 Refresh", key="refresh_button"):
+        st.cache_data.clear()
+    
     # Status bar
-    status = get_api_data("/status")
-    if status:
-        controls.render_status_bar(status)
-    else:
+    status = get_api_data("/status", max_age=refresh_rate)
+    if not status:
         st.error("⚠️ Backend not responding. Make sure to run: `python backend/main.py`")
         st.stop()
     
+    # Live panels rerun on their own timer instead of rerunning the whole script,
+    # and read through the cache with max_age=refresh_rate so every panel polling
+    # within the same tick shares one request
+    live_interval = timedelta(seconds=refresh_rate)
+    st.fragment(render_live_status, run_every=live_interval)(refresh_rate)
+    
     st.markdown("---")
     
     # Main content tabs
@@ -107,243 +463,22 @@ def main():
         "⚙️ Settings"
     ])
     
-    # ==================================================================
-    # TAB 1: PRICE ANALYSIS
-    # ==================================================================
+    # Each tab is a fragment, so interacting with one only reruns that tab.
+    # The price charts and metric panels poll; the rest refresh on demand
     with tab1:
-        st.subheader(f"💹 {symbol} Price Analysis")
-        
-        # Metrics
-        analytics = get_api_data(f"/analytics/{symbol}")
-        if analytics:
-            controls.render_metrics_cards(analytics)
-            st.divider()
-            controls.render_moving_averages_metrics(analytics)
-        
-        st.divider()
-        
-        # Charts
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Price chart
-            ticks = get_api_data("/ticks/latest", {"symbol": symbol, "limit": 100})
-            if ticks and len(ticks) > 0:
-                timestamps = [datetime.fromtimestamp(t["timestamp"]/1000).strftime("%H:%M:%S") for t in ticks]
-                prices = [t["mean_price"] for t in ticks]
-                fig = charts.create_price_chart(prices, timestamps, symbol)
-                st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            # RSI chart
-            if analytics and len(prices) > 0:
-                rsi_values = [analytics.get("rsi", 50)] * len(prices)
-                fig = charts.create_rsi_chart(rsi_values, timestamps)
-                st.plotly_chart(fig, use_container_width=True)
-        
-        st.divider()
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Z-Score chart
-            if analytics and ticks:
-                z_scores = [analytics.get("z_score", 0)] * len(prices)
-                fig = charts.create_zscore_chart(z_scores, timestamps, prices)
-                st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            # Volatility chart
-            if analytics and ticks:
-                volatility = [analytics.get("volatility", 0)] * len(prices)
-                fig = charts.create_volatility_chart(volatility, timestamps)
-                st.plotly_chart(fig, use_container_width=True)
-        
-        st.divider()
-        
-        # Moving averages
-        if analytics and ticks:
-            sma = [analytics.get("sma_20", 0)] * len(prices)
-            ema = [analytics.get("ema_20", 0)] * len(prices)
-            fig = charts.create_moving_averages_chart(prices, sma, ema, timestamps)
-            st.plotly_chart(fig, use_container_width=True, key="ma_chart")
-    
-    # ==================================================================
-    # TAB 2: ADVANCED ANALYTICS
-    # ==================================================================
+        st.fragment(render_price_analysis, run_every=live_interval)(symbol, refresh_rate)
+    
     with tab2:
-        st.subheader("🔬 Advanced Analytics")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.write("### Statistical Metrics")
-            analytics = get_api_data(f"/analytics/{symbol}")
-            if analytics:
-                controls.render_advanced_metrics(analytics)
-        
-        with col2:
-            st.write("### Correlation Matrix")
-            corr_data = get_api_data("/correlations")
-            if corr_data:
-                correlations = corr_data.get("correlations", {})
-                fig = charts.create_correlation_heatmap(correlations)
-                st.plotly_chart(fig, use_container_width=True)
-        
-        st.divider()
-        
-        # Clustering
-        st.write("### Symbol Clustering")
-        clustering = get_api_data("/clustering")
-        if clustering:
-            clusters = clustering.get("clusters", [])
-            for i, cluster in enumerate(clusters):
-                st.info(f"**Cluster {i+1}:** {', '.join(cluster)}")
-        
-        st.divider()
-        
-        # Price history
-        st.write("### Price History")
-        history = get_api_data(f"/price-history/{symbol}", {"limit": 50})
-        if history and history.get("prices"):
-            history_df = pd.DataFrame({
-                "Index": range(len(history["prices"])),
-                "Price": history["prices"]
-            })
-            st.line_chart(history_df.set_index("Index"), use_container_width=True)
-    
-    # ==================================================================
-    # TAB 3: ALERTS
-    # ==================================================================
+        render_advanced_analytics(symbol, refresh_rate)
+    
     with tab3:
-        st.subheader("🚨 Alert Management")
-        
-        col1, col2 = st.columns([2, 1])
-        
-        with col1:
-            alerts.render_alert_manager()
-        
-        with col2:
-            alerts.render_notification_sound_control()
-        
-        st.divider()
-        
-        # Alert rules
-        rules_response = get_api_data("/alerts/rules")
-        if rules_response:
-            alerts.render_alert_rules(rules_response)
-        
-        st.divider()
-        
-        # Alert history
-        history_response = get_api_data("/alerts/history")
-        if history_response:
-            alert_list = history_response.get("alerts", [])
-            if alert_list:
-                alerts.render_alert_history(alert_list)
-                alerts.render_alert_statistics(alert_list)
-            else:
-                st.info("No alerts triggered yet.")
-    
-    # ==================================================================
-    # TAB 4: BACKTESTING
-    # ==================================================================
+        render_alerts_tab()
+    
     with tab4:
-        st.subheader("📊 Mean-Reversion Backtest")
-        
-        col1, col2 = st.columns([1, 3])
-        
-        with col1:
-            backtest_symbol = st.selectbox(
-                "Select Symbol",
-                ["BTCUSDT", "ETHUSDT"],
-                key="backtest_symbol"
-            )
-            
-            if st.button("▶️ Run Backtest", use_container_width=True):
-                with st.spinner("Running backtest..."):
-                    result = get_api_data(f"/backtest/{backtest_symbol}")
-                    if result:
-                        st.success("Backtest completed!")
-                        
-                        col1_bt, col2_bt, col3_bt = st.columns(3)
-                        with col1_bt:
-                            st.metric("Total Trades", result.get("trades", 0))
-                        with col2_bt:
-                            st.metric("Win Rate", f"{result.get('win_rate', 0)*100:.1f}%")
-                        with col3_bt:
-                            st.metric("Total PnL", f"${result.get('total_pnl', 0):.2f}")
-                        
-                        st.divider()
-                        
-                        col1_bt, col2_bt = st.columns(2)
-                        with col1_bt:
-                            st.metric("Wins", result.get("wins", 0))
-                            st.metric("Losses", result.get("losses", 0))
-                        with col2_bt:
-                            st.metric("Avg PnL per Trade", f"${result.get('avg_pnl', 0):.2f}")
-        
-        with col2:
-            st.info("""
-            ### Mean-Reversion Strategy
-            - **Entry Signal**: Z-Score > 2.0 (SHORT) or Z-Score < -2.0 (LONG)
-            - **Exit Signal**: Z-Score = 0 (mean)
-            - **Backtest Window**: Last 60 sampling periods (5 minutes)
-            
-            ### Key Metrics
-            - **Win Rate**: % of profitable trades
-            - **Total PnL**: Sum of all trade profits/losses
-            - **Avg PnL**: Average profit/loss per trade
-            """)
-    
-    # ==================================================================
-    # TAB 5: SETTINGS
-    # ==================================================================
+        render_backtest_tab()
+    
     with tab5:
-        st.subheader("⚙️ Dashboard Settings")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.write("### Data Export")
-            export_symbol = st.selectbox("Export Symbol", ["BTCUSDT", "ETHUSDT"])
-            export_hours = st.slider("Export Period (hours)", 1, 24, 1)
-            
-            if st.button("📥 Export to CSV", use_container_width=True):
-                try:
-                    response = requests.get(
-                        f"{API_BASE_URL}/export/csv",
-                        params={"symbol": export_symbol, "hours": export_hours},
-                        timeout=10
-                    )
-                    if response.status_code == 200:
-                        st.download_button(
-                            label="⬇️ Download CSV",
-                            data=response.text,
-                            file_name=f"{export_symbol}_analytics_{datetime.now().isoformat()}.csv",
-                            mime="text/csv"
-                        )
-                        st.success("Export ready!")
-                except Exception as e:
-                    st.error(f"Export failed: {e}")
-        
-        with col2:
-            st.write("### API Information")
-            st.info(f"""
-            **Backend URL:** {API_BASE_URL}
-            **Status:** {'🟢 Connected' if status else '🔴 Disconnected'}
-            **API Version:** v1.0
-            """)
-        
-        st.divider()
-        
-        st.write("### Dashboard Info")
-        st.markdown("""
-        - **Real-time Data:** Updated every 5 seconds
-        - **Data Source:** Binance Futures WebSocket
-        - **Database:** SQLite (data/ticks.db)
-        - **Analytics Engine:** Python (pandas, statsmodels, scikit-learn)
-        """)
+        render_settings_tab(status)
     
     # Footer
     st.divider()
@@ -0,0 +1,18 @@
+"""Shared Plotly template for dashboard charts."""
+import plotly.graph_objects as go
+import plotly.io as pio
+
+# plotly_dark with the dashboard's slate palette, grid and margins baked in,
+# so chart builders only set what differs per chart
+quant_template = go.layout.Template(pio.templates["plotly_dark"])
+quant_template.layout.update(
+    paper_bgcolor='#0f172a',
+    plot_bgcolor='#1e293b',
+    font=dict(family="Arial, sans-serif", size=12, color='#e2e8f0'),
+    margin=dict(l=50, r=50, t=50, b=50),
+    xaxis=dict(showgrid=True, gridwidth=1, gridcolor='#334155'),
+    yaxis=dict(showgrid=True, gridwidth=1, gridcolor='#334155'),
+)
+
+pio.templates["quant"] = quant_template
+pio.templates.default = "quant"
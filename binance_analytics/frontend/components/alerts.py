@@ -1,8 +1,11 @@
 """Alert components and notifications for Streamlit dashboard."""
 import streamlit as st
+import pandas as pd
 from typing import List, Dict
 from datetime import datetime
 
+from .controls import ALERT_CONDITIONS, ALERT_METRICS, SYMBOLS, dashboard_symbol_index, local_tz, minify_css, render_stat_row
+
 
 def render_alert_banner(alert: Dict) -> None:
     """Render a single alert banner."""
@@ -21,26 +24,37 @@ def render_alert_banner(alert: Dict) -> None:
     """, unsafe_allow_html=True)
 
 
-def render_alert_history(alerts: List[Dict], limit: int = 10) -> None:
+@st.cache_data(
+    ttl=30,
+    show_spinner=False,
+    # History only ever grows at the end, so length + newest timestamp identify it
+    hash_funcs={list: lambda alerts: (len(alerts), alerts[-1]["timestamp"] if alerts else None)},
+)
+def alerts_frame(alerts: List[Dict]) -> pd.DataFrame:
+    """Alert history as a DataFrame, built once per new alert."""
+    return pd.DataFrame(alerts, columns=["rule_id", "timestamp", "symbol", "metric", "actual_value", "threshold"])
+
+
+def render_alert_history(alerts: pd.DataFrame, limit: int = 10) -> None:
     """Render alert history table."""
     st.subheader("📋 Recent Alerts")
     
-    if not alerts:
+    if alerts.empty:
         st.info("No alerts triggered yet.")
         return
     
     # Display latest alerts
-    recent_alerts = alerts[-limit:]
-    
-    alert_data = []
-    for alert in recent_alerts:
-        alert_data.append({
-            "Time": datetime.fromtimestamp(alert["timestamp"] / 1000).strftime("%H:%M:%S"),
-            "Symbol": alert["symbol"],
-            "Metric": alert["metric"].upper(),
-            "Actual": f"{alert['actual_value']:.4f}",
-            "Threshold": f"{alert['threshold']:.4f}",
-        })
+    recent_alerts = alerts.tail(limit)
+    
+    alert_data = pd.DataFrame({
+        "Time": pd.to_datetime(recent_alerts["timestamp"], unit="ms", utc=True)
+        .dt.tz_convert(local_tz())
+        .dt.strftime("%H:%M:%S"),
+        "Symbol": recent_alerts["symbol"],
+        "Metric": recent_alerts["metric"].str.upper(),
+        "Actual": recent_alerts["actual_value"].map("{:.4f}".format),
+        "Threshold": recent_alerts["threshold"].map("{:.4f}".format),
+    })
     
     st.dataframe(alert_data, use_container_width=True, hide_index=True)
 
@@ -68,9 +82,8 @@ def render_alert_rules(rules: List[Dict]) -> None:
     st.dataframe(rule_data, use_container_width=True, hide_index=True)
 
 
-def create_alert_sound_css() -> None:
-    """Inject CSS for alert animations."""
-    st.markdown("""
+# Minified once at import; reruns re-send this string, so keep it small
+ALERT_CSS = minify_css("""
     <style>
         .pulse-animation {
             animation: pulse 1s infinite;
@@ -111,6 +124,12 @@ def create_alert_sound_css() -> None:
             }
         }
         
+        @media (prefers-reduced-motion: reduce) {
+            .pulse-animation, .bounce-animation, .flash-animation {
+                animation: none;
+            }
+        }
+        
         .alert-sound-toggle {
             position: fixed;
             top: 80px;
@@ -118,7 +137,12 @@ def create_alert_sound_css() -> None:
             z-index: 999;
         }
     </style>
-    """, unsafe_allow_html=True)
+""")
+
+
+def create_alert_sound_css() -> None:
+    """Inject CSS for alert animations."""
+    st.markdown(ALERT_CSS, unsafe_allow_html=True)
 
 
 def render_alert_manager() -> None:
@@ -126,64 +150,59 @@ def render_alert_manager() -> None:
     st.subheader("🎯 Alert Rule Manager")
     
     with st.expander("➕ Create New Alert Rule"):
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            alert_symbol = st.selectbox(
-                "Symbol",
-                ["BTCUSDT", "ETHUSDT"],
-                key="new_alert_symbol"
-            )
-            alert_metric = st.selectbox(
-                "Metric",
-                ["z_score", "volatility", "price", "rsi"],
-                key="new_alert_metric"
-            )
-        
-        with col2:
-            alert_condition = st.selectbox(
-                "Condition",
-                [">", "<", ">=", "<=", "=="],
-                key="new_alert_condition"
-            )
-            alert_threshold = st.number_input(
-                "Threshold",
-                value=2.0,
-                step=0.1,
-                key="new_alert_threshold"
-            )
+        # Editing the fields doesn't rerun anything until the form is submitted
+        with st.form("alert_manager_form", border=False):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                alert_symbol = st.selectbox(
+                    "Symbol",
+                    SYMBOLS,
+                    index=dashboard_symbol_index()
+                )
+                alert_metric = st.selectbox(
+                    "Metric",
+                    ALERT_METRICS,
+                    key="new_alert_metric"
+                )
+            
+            with col2:
+                alert_condition = st.selectbox(
+                    "Condition",
+                    ALERT_CONDITIONS,
+                    key="new_alert_condition"
+                )
+                alert_threshold = st.number_input(
+                    "Threshold",
+                    value=2.0,
+                    step=0.1,
+                    key="new_alert_threshold"
+                )
+            
+            submitted = st.form_submit_button("🔔 Create Alert", use_container_width=True)
         
-        if st.button("🔔 Create Alert", use_container_width=True):
+        if submitted:
+            st.session_state["last_alert"] = (alert_symbol, alert_metric, alert_condition, alert_threshold)
             st.success(f"Alert created: {alert_symbol} {alert_metric} {alert_condition} {alert_threshold}")
 
 
-def render_alert_statistics(alerts: List[Dict]) -> None:
+def render_alert_statistics(alerts: pd.DataFrame) -> None:
     """Render alert statistics."""
     st.subheader("📊 Alert Statistics")
     
-    if not alerts:
+    if alerts.empty:
         st.info("No alerts to display.")
         return
     
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("Total Alerts", len(alerts))
-    
-    with col2:
-        unique_symbols = len(set(a["symbol"] for a in alerts))
-        st.metric("Unique Symbols", unique_symbols)
-    
-    with col3:
-        unique_metrics = len(set(a["metric"] for a in alerts))
-        st.metric("Alert Types", unique_metrics)
+    unique = alerts[["symbol", "metric"]].nunique()
+    mins_ago = (datetime.now().timestamp() * 1000 - alerts["timestamp"].max()) / 60000
     
-    with col4:
-        if alerts:
-            latest_time = max(a["timestamp"] for a in alerts)
-            from datetime import datetime, timedelta
-            mins_ago = (datetime.now().timestamp() * 1000 - latest_time) / 60000
-            st.metric("Latest Alert", f"{mins_ago:.0f}m ago")
+    render_stat_row({
+        "Total Alerts": f"{len(alerts):,}",
+        "Unique Symbols": f"{unique['symbol']}",
+        "Alert Types": f"{unique['metric']}",
+        "Latest Alert": f"{mins_ago:.0f}m ago",
+    })
 
 
 def render_notification_sound_control() -> bool:
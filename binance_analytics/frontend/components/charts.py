@@ -2,12 +2,33 @@
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 import numpy as np
 
+from . import _template  # noqa: F401  registers the default "quant" template
+
+# Plotly >= 5.24 ships NumPy arrays to the browser as base64 typed arrays
+# instead of JSON number lists. Prices keep float64 so cent-level hover
+# values stay exact at BTC magnitudes; derived indicators fit in float32.
+PRICE_DTYPE = np.float64
+SERIES_DTYPE = np.float32
+
+# Shown in the correlation heatmap before any pair correlation exists
+DEFAULT_SYMBOLS = ("BTCUSDT", "ETHUSDT")
+
+# Indicator inputs may be a full series or just the latest value; a single
+# value is drawn as a horizontal line rather than an N-point flat trace
+Series = Union[float, List[float], np.ndarray]
+
+
+def _is_scalar(values: Series) -> bool:
+    return np.ndim(values) == 0
+
 
 def create_price_chart(prices: List[float], timestamps: List[float], symbol: str = "BTCUSDT") -> go.Figure:
     """Create animated price chart."""
+    prices = np.asarray(prices, dtype=PRICE_DTYPE)
+    
     fig = go.Figure()
     
     fig.add_trace(go.Scatter(
@@ -25,36 +46,33 @@ def create_price_chart(prices: List[float], timestamps: List[float], symbol: str
         xaxis_title="Time",
         yaxis_title="Price (USD)",
         hovermode='x unified',
-        template='plotly_dark',
-        paper_bgcolor='#0f172a',
-        plot_bgcolor='#1e293b',
-        font=dict(family="Arial, sans-serif", size=12, color='#e2e8f0'),
         height=400,
-        margin=dict(l=50, r=50, t=50, b=50),
     )
     
-    fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='#334155')
-    fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='#334155')
-    
     return fig
 
 
-def create_zscore_chart(z_scores: List[float], timestamps: List[float], prices: List[float]) -> go.Figure:
+def create_zscore_chart(z_scores: Series, timestamps: List[float], prices: List[float]) -> go.Figure:
     """Create animated Z-score chart with price."""
+    prices = np.asarray(prices, dtype=PRICE_DTYPE)
+    
     fig = make_subplots(specs=[[{"secondary_y": True}]])
     
     # Z-Score trace
-    fig.add_trace(
-        go.Scatter(
-            x=timestamps,
-            y=z_scores,
-            mode='lines',
-            name='Z-Score',
-            line=dict(color='#00FFB3', width=2),
-            hovertemplate='<b>%{x}</b><br>Z-Score: %{y:.3f}<extra></extra>',
-        ),
-        secondary_y=False,
-    )
+    if _is_scalar(z_scores):
+        fig.add_hline(y=z_scores, line_color='#00FFB3', line_width=2, annotation_text=f"Z-Score {z_scores:.3f}", annotation_position="top left", secondary_y=False, exclude_empty_subplots=False)
+    else:
+        fig.add_trace(
+            go.Scatter(
+                x=timestamps,
+                y=np.asarray(z_scores, dtype=SERIES_DTYPE),
+                mode='lines',
+                name='Z-Score',
+                line=dict(color='#00FFB3', width=2),
+                hovertemplate='<b>%{x}</b><br>Z-Score: %{y:.3f}<extra></extra>',
+            ),
+            secondary_y=False,
+        )
     
     # Price trace
     fig.add_trace(
@@ -71,24 +89,17 @@ def create_zscore_chart(z_scores: List[float], timestamps: List[float], prices:
     
     # Add threshold lines
     if len(timestamps) > 0:
-        fig.add_hline(y=2.0, line_dash="dash", line_color="red", annotation_text="Short Entry (Z>2)", secondary_y=False)
-        fig.add_hline(y=-2.0, line_dash="dash", line_color="green", annotation_text="Long Entry (Z<-2)", secondary_y=False)
-        fig.add_hline(y=0.0, line_dash="solid", line_color="grey", annotation_text="Mean", secondary_y=False)
+        fig.add_hline(y=2.0, line_dash="dash", line_color="red", annotation_text="Short Entry (Z>2)", secondary_y=False, exclude_empty_subplots=False)
+        fig.add_hline(y=-2.0, line_dash="dash", line_color="green", annotation_text="Long Entry (Z<-2)", secondary_y=False, exclude_empty_subplots=False)
+        fig.add_hline(y=0.0, line_dash="solid", line_color="grey", annotation_text="Mean", secondary_y=False, exclude_empty_subplots=False)
     
     fig.update_layout(
         title="<b>Z-Score & Price</b>",
         xaxis_title="Time",
         hovermode='x unified',
-        template='plotly_dark',
-        paper_bgcolor='#0f172a',
-        plot_bgcolor='#1e293b',
-        font=dict(family="Arial, sans-serif", size=12, color='#e2e8f0'),
         height=400,
-        margin=dict(l=50, r=50, t=50, b=50),
     )
     
-    fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='#334155')
-    fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='#334155', secondary_y=False)
     fig.update_yaxes(showgrid=False, secondary_y=True)
     
     fig.update_yaxes(title_text="Z-Score", secondary_y=False)
@@ -97,19 +108,24 @@ def create_zscore_chart(z_scores: List[float], timestamps: List[float], prices:
     return fig
 
 
-def create_volatility_chart(volatility: List[float], timestamps: List[float]) -> go.Figure:
+def create_volatility_chart(volatility: Series, timestamps: List[float]) -> go.Figure:
     """Create volatility over time chart."""
-    colors = ['#FF6B6B' if v > 0.05 else '#4ECDC4' for v in volatility]
-    
     fig = go.Figure()
     
-    fig.add_trace(go.Bar(
-        x=timestamps,
-        y=volatility,
-        marker=dict(color=colors),
-        name='Volatility',
-        hovertemplate='<b>%{x}</b><br>Vol: %{y:.4f}<extra></extra>',
-    ))
+    if _is_scalar(volatility):
+        color = '#FF6B6B' if volatility > 0.05 else '#4ECDC4'
+        fig.add_hline(y=volatility, line_color=color, line_width=2, annotation_text=f"Vol {volatility:.4f}", annotation_position="top left")
+    else:
+        volatility = np.asarray(volatility, dtype=SERIES_DTYPE)
+        colors = np.where(volatility > 0.05, '#FF6B6B', '#4ECDC4')
+        
+        fig.add_trace(go.Bar(
+            x=timestamps,
+            y=volatility,
+            marker=dict(color=colors),
+            name='Volatility',
+            hovertemplate='<b>%{x}</b><br>Vol: %{y:.4f}<extra></extra>',
+        ))
     
     fig.add_hline(y=0.05, line_dash="dash", line_color="orange", annotation_text="High Vol Threshold")
     
@@ -118,35 +134,31 @@ def create_volatility_chart(volatility: List[float], timestamps: List[float]) ->
         xaxis_title="Time",
         yaxis_title="Volatility",
         hovermode='x unified',
-        template='plotly_dark',
-        paper_bgcolor='#0f172a',
-        plot_bgcolor='#1e293b',
-        font=dict(family="Arial, sans-serif", size=12, color='#e2e8f0'),
         height=350,
-        margin=dict(l=50, r=50, t=50, b=50),
         showlegend=False,
     )
     
-    fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='#334155')
-    fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='#334155')
-    
     return fig
 
 
-def create_rsi_chart(rsi: List[float], timestamps: List[float]) -> go.Figure:
+def create_rsi_chart(rsi: Series, timestamps: List[float]) -> go.Figure:
     """Create RSI chart."""
     fig = go.Figure()
     
-    fig.add_trace(go.Scatter(
-        x=timestamps,
-        y=rsi,
-        mode='lines',
-        name='RSI(14)',
-        line=dict(color='#FF9F43', width=2),
-        fill='tozeroy',
-        fillcolor='rgba(255, 159, 67, 0.2)',
-        hovertemplate='<b>%{x}</b><br>RSI: %{y:.2f}<extra></extra>',
-    ))
+    if _is_scalar(rsi):
+        fig.add_hrect(y0=0, y1=rsi, fillcolor='rgba(255, 159, 67, 0.2)', line_width=0)
+        fig.add_hline(y=rsi, line_color='#FF9F43', line_width=2, annotation_text=f"RSI(14) {rsi:.2f}", annotation_position="top left")
+    else:
+        fig.add_trace(go.Scatter(
+            x=timestamps,
+            y=np.asarray(rsi, dtype=SERIES_DTYPE),
+            mode='lines',
+            name='RSI(14)',
+            line=dict(color='#FF9F43', width=2),
+            fill='tozeroy',
+            fillcolor='rgba(255, 159, 67, 0.2)',
+            hovertemplate='<b>%{x}</b><br>RSI: %{y:.2f}<extra></extra>',
+        ))
     
     # Overbought/oversold zones
     fig.add_hline(y=70, line_dash="dash", line_color="red", annotation_text="Overbought")
@@ -158,31 +170,23 @@ def create_rsi_chart(rsi: List[float], timestamps: List[float]) -> go.Figure:
         xaxis_title="Time",
         yaxis_title="RSI",
         hovermode='x unified',
-        template='plotly_dark',
-        paper_bgcolor='#0f172a',
-        plot_bgcolor='#1e293b',
-        font=dict(family="Arial, sans-serif", size=12, color='#e2e8f0'),
         height=350,
-        margin=dict(l=50, r=50, t=50, b=50),
         yaxis=dict(range=[0, 100]),
     )
     
-    fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='#334155')
-    fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='#334155')
-    
     return fig
 
 
 def create_correlation_heatmap(correlations: Dict[str, float]) -> go.Figure:
-    """Create correlation heatmap."""
-    symbols = ["BTCUSDT", "ETHUSDT"]
+    """Create correlation heatmap from "SYM1-SYM2" keyed pair correlations."""
+    pairs = [(key.split("-", 1), corr) for key, corr in correlations.items()]
+    symbols = sorted({symbol for pair, _ in pairs for symbol in pair}) or DEFAULT_SYMBOLS
+    index = {symbol: i for i, symbol in enumerate(symbols)}
     
-    # Create matrix
-    matrix = [[1.0, 0.0], [0.0, 1.0]]
-    
-    for key, corr in correlations.items():
-        if "BTCUSDT" in key and "ETHUSDT" in key:
-            matrix[0][1] = matrix[1][0] = corr
+    # Pairs the backend has no correlation for yet stay at 0
+    matrix = np.eye(len(symbols))
+    for (sym1, sym2), corr in pairs:
+        matrix[index[sym1], index[sym2]] = matrix[index[sym2], index[sym1]] = corr
     
     fig = go.Figure(data=go.Heatmap(
         z=matrix,
@@ -192,8 +196,7 @@ def create_correlation_heatmap(correlations: Dict[str, float]) -> go.Figure:
         zmid=0,
         zmin=-1,
         zmax=1,
-        text=matrix,
-        texttemplate='%{text:.3f}',
+        texttemplate='%{z:.3f}',
         textfont={"size": 14},
         colorbar=dict(title="Correlation"),
     ))
@@ -201,19 +204,16 @@ def create_correlation_heatmap(correlations: Dict[str, float]) -> go.Figure:
     fig.update_layout(
         title="<b>Symbol Correlation Matrix</b>",
         hovermode='closest',
-        template='plotly_dark',
-        paper_bgcolor='#0f172a',
-        plot_bgcolor='#1e293b',
-        font=dict(family="Arial, sans-serif", size=12, color='#e2e8f0'),
         height=350,
-        margin=dict(l=50, r=50, t=50, b=50),
     )
     
     return fig
 
 
-def create_moving_averages_chart(prices: List[float], sma: List[float], ema: List[float], timestamps: List[float]) -> go.Figure:
+def create_moving_averages_chart(prices: List[float], sma: Series, ema: Series, timestamps: List[float]) -> go.Figure:
     """Create moving averages chart."""
+    prices = np.asarray(prices, dtype=PRICE_DTYPE)
+    
     fig = go.Figure()
     
     fig.add_trace(go.Scatter(
@@ -224,44 +224,43 @@ def create_moving_averages_chart(prices: List[float], sma: List[float], ema: Lis
         line=dict(color='#00D4FF', width=1),
     ))
     
-    fig.add_trace(go.Scatter(
-        x=timestamps,
-        y=sma,
-        mode='lines',
-        name='SMA(20)',
-        line=dict(color='#FFD700', width=2, dash='dash'),
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=timestamps,
-        y=ema,
-        mode='lines',
-        name='EMA(20)',
-        line=dict(color='#FF9F43', width=2),
-    ))
+    if _is_scalar(sma):
+        fig.add_hline(y=sma, line_color='#FFD700', line_width=2, line_dash='dash', annotation_text="SMA(20)", annotation_position="top left")
+    else:
+        fig.add_trace(go.Scatter(
+            x=timestamps,
+            y=np.asarray(sma, dtype=PRICE_DTYPE),
+            mode='lines',
+            name='SMA(20)',
+            line=dict(color='#FFD700', width=2, dash='dash'),
+        ))
+    
+    if _is_scalar(ema):
+        fig.add_hline(y=ema, line_color='#FF9F43', line_width=2, annotation_text="EMA(20)", annotation_position="bottom left")
+    else:
+        fig.add_trace(go.Scatter(
+            x=timestamps,
+            y=np.asarray(ema, dtype=PRICE_DTYPE),
+            mode='lines',
+            name='EMA(20)',
+            line=dict(color='#FF9F43', width=2),
+        ))
     
     fig.update_layout(
         title="<b>Price & Moving Averages</b>",
         xaxis_title="Time",
         yaxis_title="Price (USD)",
         hovermode='x unified',
-        template='plotly_dark',
-        paper_bgcolor='#0f172a',
-        plot_bgcolor='#1e293b',
-        font=dict(family="Arial, sans-serif", size=12, color='#e2e8f0'),
         height=400,
-        margin=dict(l=50, r=50, t=50, b=50),
     )
     
-    fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='#334155')
-    fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='#334155')
-    
     return fig
 
 
 def create_volume_chart(volumes: List[float], timestamps: List[float], symbol: str = "BTCUSDT") -> go.Figure:
     """Create volume chart."""
-    colors = ['#00FFB3' if i % 2 == 0 else '#FF6B9D' for i in range(len(volumes))]
+    volumes = np.asarray(volumes, dtype=SERIES_DTYPE)
+    colors = np.where(np.arange(len(volumes)) % 2 == 0, '#00FFB3', '#FF6B9D')
     
     fig = go.Figure()
     
@@ -278,16 +277,8 @@ def create_volume_chart(volumes: List[float], timestamps: List[float], symbol: s
         xaxis_title="Time",
         yaxis_title="Volume",
         hovermode='x unified',
-        template='plotly_dark',
-        paper_bgcolor='#0f172a',
-        plot_bgcolor='#1e293b',
-        font=dict(family="Arial, sans-serif", size=12, color='#e2e8f0'),
         height=350,
-        margin=dict(l=50, r=50, t=50, b=50),
         showlegend=False,
     )
     
-    fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='#334155')
-    fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='#334155')
-    
     return fig
@@ -1,63 +1,93 @@
 """UI controls and components for Streamlit dashboard."""
+import re
+import time
+from datetime import datetime, tzinfo
+from functools import lru_cache
+import numpy as np
 import streamlit as st
-from typing import Tuple, Dict
+from typing import Tuple, Dict, NamedTuple, Optional, Union
+
+# Widget options, built once and shared by every render
+SYMBOLS = ("BTCUSDT", "ETHUSDT")
+REFRESH_RATES = (2, 5, 10, 30)
+ALERT_METRICS = ("z_score", "volatility", "price", "rsi")
+ALERT_CONDITIONS = (">", "<", ">=", "<=", "==")
+
+# Session key of the dashboard's symbol picker, the one symbol selection
+# every other panel follows
+SYMBOL_KEY = "symbol_select"
+
+
+def local_tz() -> tzinfo:
+    """
+    The server's current UTC offset, for showing epoch-ms times as local time.
+    
+    Looked up on every call rather than once at import, so a long-running
+    server picks up DST changes.
+    """
+    return datetime.now().astimezone().tzinfo
+
+
+# Static header/footer markup, each sent as a single element
+HEADER_HTML = (
+    '<div class="header-title">💹 Live Quant Analytics</div>'
+    '<div class="header-subtitle">Real-time Trading Dashboard with Advanced Analytics</div>'
+    '<hr>'
+)
+
+FOOTER_HTML = (
+    '<hr><div class="footer-row">'
+    '<span>🔌 Connected to: Binance Futures WebSocket</span>'
+    '<span>⚡ Backend: FastAPI + SQLite</span>'
+    '<span>💡 Data updated every 5 seconds</span>'
+    '</div>'
+)
 
 
 def render_header() -> None:
-    """Render dashboard header."""
-    st.markdown("""
-    <style>
-        .header-title {
-            font-size: 3rem;
-            font-weight: 700;
-            background: linear-gradient(135deg, #00D4FF, #00FFB3);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            margin-bottom: 0.5rem;
-        }
-        .header-subtitle {
-            font-size: 1.1rem;
-            color: #a0aec0;
-            margin-bottom: 1rem;
-        }
-    </style>
-    """, unsafe_allow_html=True)
-    
-    st.markdown('<div class="header-title">💹 Live Quant Analytics</div>', unsafe_allow_html=True)
-    st.markdown('<div class="header-subtitle">Real-time Trading Dashboard with Advanced Analytics</div>', unsafe_allow_html=True)
-    st.markdown("---")
+    """Render dashboard header (its styles ship with apply_custom_css)."""
+    st.markdown(HEADER_HTML, unsafe_allow_html=True)
+
+
+class Controls(NamedTuple):
+    """Top control bar selections; hashable, so usable as a cache key."""
+    symbol: str
+    refresh_rate: int
+    z_threshold: float
 
 
-def render_top_controls() -> Tuple[str, int, float]:
+def dashboard_symbol_index() -> int:
+    """
+    Position of the dashboard's symbol in SYMBOLS.
+    
+    Panel symbol pickers pass this as their ``index`` and take no key of
+    their own, so they start on the dashboard symbol and follow it when it
+    changes, instead of each keeping a separate selection in session state.
+    """
+    return SYMBOLS.index(st.session_state.get(SYMBOL_KEY, SYMBOLS[0]))
+
+
+def render_top_controls() -> Controls:
     """Render top control bar."""
-    col1, col2, col3, col4 = st.columns([1.5, 1, 1, 1])
+    col1, col2, col3 = st.columns([1.5, 1, 1])
     
     with col1:
         symbol = st.selectbox(
             "📈 Select Symbol",
-            ["BTCUSDT", "ETHUSDT"],
-            key="symbol_select"
+            SYMBOLS,
+            key=SYMBOL_KEY
         )
     
     with col2:
         refresh_rate = st.selectbox(
             "🔄 Refresh Rate",
-            [2, 5, 10, 30],
+            REFRESH_RATES,
             index=1,
             help="Dashboard refresh interval in seconds",
             key="refresh_select"
         )
     
     with col3:
-        window_size = st.selectbox(
-            "⏱ Window Size",
-            [10, 20, 60],
-            index=1,
-            help="Analytics window size in seconds",
-            key="window_select"
-        )
-    
-    with col4:
         z_threshold = st.slider(
             "⚡ Z-Threshold",
             1.0, 5.0, 2.0, 0.1,
@@ -65,45 +95,95 @@ def render_top_controls() -> Tuple[str, int, float]:
             key="z_threshold"
         )
     
-    return symbol, refresh_rate, z_threshold
+    return Controls(symbol, refresh_rate, z_threshold)
 
 
 def render_status_bar(status: Dict) -> None:
     """Render connection status bar."""
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        status_color = "🟢" if status.get("status") == "connected" else "🔴"
-        st.metric(
-            "Connection",
-            f"{status_color} {status.get('status', 'unknown')}",
-            "Live" if status.get("status") == "connected" else "Offline"
-        )
-    
-    with col2:
-        uptime_minutes = status.get("uptime_seconds", 0) / 60
-        st.metric(
-            "Uptime",
-            f"{uptime_minutes:.1f}m",
-            f"{status.get('uptime_seconds', 0):.0f}s"
-        )
-    
-    with col3:
-        st.metric(
-            "Ticks Received",
-            f"{status.get('ticks_received', 0):,}",
-            "Live feed"
-        )
+    now_ms = time.time() * 1000
+    state = status.get("status", "unknown")
+    connected = state == "connected"
+    uptime = status.get("uptime_seconds", 0)
+    
+    cards = {
+        "Connection": (f"{'🟢' if connected else '🔴'} {state}", "Live" if connected else "Offline"),
+        "Uptime": (f"{uptime / 60:.1f}m", f"{uptime:.0f}s"),
+        "Ticks Received": (f"{status.get('ticks_received', 0):,}", "Live feed"),
+    }
+    
+    if status.get('last_tick_timestamp'):
+        elapsed = (now_ms - status['last_tick_timestamp']) / 1000
+        cards["Last Tick"] = (f"{elapsed:.1f}s ago", "Real-time")
+    
+    render_stat_row(cards)
+
+
+# Badge lookup tables, indexed by band() below
+_TREND_DOTS = {"uptrend": "🟢", "downtrend": "🔴"}
+_VOL_BADGES = ("🟢 LOW", "🔴 HIGH")
+_Z_BADGES = ("🟢 LONG", "🟡 NEUTRAL", "🔴 SHORT")
+_RSI_BADGES = ("🟢 OVERSOLD", "🟡 NEUTRAL", "🔴 OVERBOUGHT")
+_CORR_STRENGTHS = ("Weak", "Moderate", "Strong")
+
+
+@lru_cache(maxsize=None)
+def _trend_badge(trend: str) -> str:
+    # Only a handful of trend values exist, so this fills up after a few calls
+    return f"{_TREND_DOTS.get(trend, '🟡')} {trend.upper()}"
+
+
+def band(value, low: float, high: float):
+    """0 below ``low``, 1 within [low, high], 2 above ``high``.
     
-    with col4:
-        if status.get('last_tick_timestamp'):
-            import time
-            elapsed = (time.time() * 1000 - status['last_tick_timestamp']) / 1000
-            st.metric(
-                "Last Tick",
-                f"{elapsed:.1f}s ago",
-                "Real-time"
-            )
+    Matches the strict ``<`` / ``>`` signal thresholds, and works unchanged on
+    NumPy arrays of values.
+    """
+    return np.add(value >= low, value > high, dtype=np.int8)
+
+
+def metric_bands(volatility, z_score, rsi) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Badge indices into the volatility, z-score and RSI tables.
+    
+    Takes single values or whole arrays (e.g. a window history for playback);
+    index the label tables with ``np.take`` for the array case.
+    """
+    volatility, z_score, rsi = (np.asarray(a, dtype=np.float64) for a in (volatility, z_score, rsi))
+    return (volatility > 0.05).astype(np.int8), band(z_score, -2, 2), band(rsi, 30, 70)
+
+
+# A symbol's metrics for a given window never change, so that pair identifies them
+_BY_WINDOW = {dict: lambda m: (m.get("symbol"), m.get("timestamp"))}
+
+
+@st.cache_data(show_spinner=False, max_entries=16, hash_funcs=_BY_WINDOW)
+def format_metric_cards(m: Dict) -> Dict[str, Tuple[str, str]]:
+    """Value and delta text for every metric card, keyed by card label."""
+    price = m["mean_price"]
+    vol_band, z_band, rsi_band = metric_bands(m["volatility"], m["z_score"], m["rsi"])
+    
+    cards = {
+        "Current Price": (f"${price:.2f}", _trend_badge(m["trend"])),
+        "Volatility (StDev)": (f"{m['volatility']:.4f}", _VOL_BADGES[vol_band]),
+        "Z-Score": (f"{m['z_score']:.3f}", _Z_BADGES[z_band]),
+        "RSI(14)": (f"{m['rsi']:.2f}", _RSI_BADGES[rsi_band]),
+        "SMA(20)": (f"${m['sma_20']:.2f}", f"${price - m['sma_20']:.2f}"),
+        "EMA(20)": (f"${m['ema_20']:.2f}", f"${price - m['ema_20']:.2f}"),
+        "Trend": (m["trend"].upper(), "Mean price vs SMA/EMA"),
+    }
+    
+    if m.get("garch_forecast"):
+        cards["GARCH Vol Forecast"] = (f"{m['garch_forecast']:.4f}", "Volatility prediction")
+    
+    corr = m.get("correlation_btc_eth")
+    if corr is not None:
+        strength = (abs(corr) > 0.5) + (abs(corr) > 0.7)
+        cards["BTC-ETH Correlation"] = (f"{corr:.3f}", _CORR_STRENGTHS[strength])
+    
+    if m.get("adf_pvalue") is not None:
+        is_stationary = m["adf_pvalue"] < 0.05
+        cards["ADF Stationarity"] = (f"{m['adf_pvalue']:.4f}", "Stationary" if is_stationary else "Non-Stationary")
+    
+    return cards
 
 
 def render_metrics_cards(metrics: Dict) -> None:
@@ -112,39 +192,16 @@ def render_metrics_cards(metrics: Dict) -> None:
         st.warning("⏳ Awaiting data...")
         return
     
-    m = metrics
-    
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        price_color = "🟢" if m["trend"] == "uptrend" else "🔴" if m["trend"] == "downtrend" else "🟡"
-        st.metric(
-            "Current Price",
-            f"${m['mean_price']:.2f}",
-            f"{price_color} {m['trend'].upper()}"
-        )
-    
-    with col2:
-        st.metric(
-            "Volatility (StDev)",
-            f"{m['volatility']:.4f}",
-            f"{'🔴 HIGH' if m['volatility'] > 0.05 else '🟢 LOW'}"
-        )
-    
-    with col3:
-        z_color = "🔴 SHORT" if m["z_score"] > 2 else "🟢 LONG" if m["z_score"] < -2 else "🟡 NEUTRAL"
-        st.metric(
-            "Z-Score",
-            f"{m['z_score']:.3f}",
-            z_color
-        )
-    
-    with col4:
-        st.metric(
-            "RSI(14)",
-            f"{m['rsi']:.2f}",
-            f"{'🔴 OVERBOUGHT' if m['rsi'] > 70 else '🟢 OVERSOLD' if m['rsi'] < 30 else '🟡 NEUTRAL'}"
-        )
+    # Idle polls between windows re-send the cached markup without rebuilding it;
+    # the element itself must still be emitted or Streamlit would clear it
+    st.markdown(headline_cards_html(metrics), unsafe_allow_html=True)
+
+
+@st.cache_data(show_spinner=False, max_entries=16, hash_funcs=_BY_WINDOW)
+def headline_cards_html(metrics: Dict) -> str:
+    """Markup for the headline metric row, built once per window."""
+    cards = format_metric_cards(metrics)
+    return stat_row_html({label: cards[label] for label in ("Current Price", "Volatility (StDev)", "Z-Score", "RSI(14)")})
 
 
 def render_moving_averages_metrics(metrics: Dict) -> None:
@@ -152,29 +209,30 @@ def render_moving_averages_metrics(metrics: Dict) -> None:
     if not metrics:
         return
     
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.metric(
-            "SMA(20)",
-            f"${metrics['sma_20']:.2f}",
-            f"${metrics['mean_price'] - metrics['sma_20']:.2f}"
-        )
-    
-    with col2:
-        st.metric(
-            "EMA(20)",
-            f"${metrics['ema_20']:.2f}",
-            f"${metrics['mean_price'] - metrics['ema_20']:.2f}"
-        )
-    
-    with col3:
-        if metrics.get('garch_forecast'):
-            st.metric(
-                "GARCH Vol Forecast",
-                f"{metrics['garch_forecast']:.4f}",
-                "Volatility prediction"
-            )
+    cards = format_metric_cards(metrics)
+    render_stat_row({label: cards[label] for label in ("SMA(20)", "EMA(20)", "GARCH Vol Forecast") if label in cards})
+
+
+def _stat_card(label: str, value: Union[str, Tuple[str, str]]) -> str:
+    value, delta = value if isinstance(value, tuple) else (value, None)
+    delta_html = f'<div class="stat-delta">{delta}</div>' if delta else ""
+    return f'<div class="stat-card"><div class="stat-label">{label}</div><div class="stat-value">{value}</div>{delta_html}</div>'
+
+
+def stat_row_html(stats: Dict[str, Union[str, Tuple[str, str]]]) -> str:
+    """Markup for a row of metric-style cards."""
+    cards = "".join(_stat_card(label, value) for label, value in stats.items())
+    return f'<div class="stat-row">{cards}</div>'
+
+
+def render_stat_row(stats: Dict[str, Union[str, Tuple[str, str]]]) -> None:
+    """
+    Render a row of metric-style cards as one element.
+    
+    Values are plain strings or (value, badge) pairs. Use st.metric instead
+    where a signed delta arrow carries meaning.
+    """
+    st.markdown(stat_row_html(stats), unsafe_allow_html=True)
 
 
 def render_advanced_metrics(metrics: Dict) -> None:
@@ -182,104 +240,94 @@ def render_advanced_metrics(metrics: Dict) -> None:
     if not metrics:
         return
     
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        if metrics.get('correlation_btc_eth') is not None:
-            corr = metrics['correlation_btc_eth']
-            st.metric(
-                "BTC-ETH Correlation",
-                f"{corr:.3f}",
-                f"{'Strong' if abs(corr) > 0.7 else 'Moderate' if abs(corr) > 0.5 else 'Weak'}"
-            )
-    
-    with col2:
-        if metrics.get('adf_pvalue') is not None:
-            is_stationary = metrics['adf_pvalue'] < 0.05
-            st.metric(
-                "ADF Stationarity",
-                f"{metrics['adf_pvalue']:.4f}",
-                f"{'Stationary' if is_stationary else 'Non-Stationary'}"
-            )
-    
-    with col3:
-        st.metric(
-            "Trend",
-            metrics['trend'].upper(),
-            "Mean price vs SMA/EMA"
-        )
+    cards = format_metric_cards(metrics)
+    render_stat_row({label: cards[label] for label in ("BTC-ETH Correlation", "ADF Stationarity", "Trend") if label in cards})
 
 
-def render_alert_panel() -> Tuple[str, str, float]:
-    """Render alert configuration panel."""
+def render_alert_panel() -> Optional[Tuple[str, str, str, float]]:
+    """
+    Render alert configuration panel.
+    
+    Returns (symbol, metric, condition, threshold) on the run the form is
+    submitted, None otherwise. The last submission is kept in
+    ``st.session_state["last_alert"]``.
+    """
     st.subheader("🚨 Create Alert Rule")
     
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        symbol = st.selectbox(
-            "Alert Symbol",
-            ["BTCUSDT", "ETHUSDT"],
-            key="alert_symbol"
-        )
-    
-    with col2:
-        metric = st.selectbox(
-            "Alert Metric",
-            ["z_score", "volatility", "price", "rsi"],
-            key="alert_metric"
-        )
-    
-    with col3:
-        condition = st.selectbox(
-            "Condition",
-            [">", "<", ">=", "<=", "=="],
-            key="alert_condition"
+    # Editing the fields doesn't rerun anything until the form is submitted
+    with st.form("alert_form", border=False):
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            symbol = st.selectbox(
+                "Alert Symbol",
+                SYMBOLS,
+                index=dashboard_symbol_index()
+            )
+        
+        with col2:
+            metric = st.selectbox(
+                "Alert Metric",
+                ALERT_METRICS,
+                key="alert_metric"
+            )
+        
+        with col3:
+            condition = st.selectbox(
+                "Condition",
+                ALERT_CONDITIONS,
+                key="alert_condition"
+            )
+        
+        threshold = st.slider(
+            "Threshold Value",
+            min_value=-10.0,
+            max_value=10.0,
+            value=2.0,
+            step=0.1,
+            key="alert_threshold"
         )
+        
+        submitted = st.form_submit_button("🔔 Create Alert", use_container_width=True)
     
-    threshold = st.slider(
-        "Threshold Value",
-        min_value=-10.0,
-        max_value=10.0,
-        value=2.0,
-        step=0.1,
-        key="alert_threshold"
-    )
+    if not submitted:
+        return None
     
-    return symbol, metric, condition, threshold
+    st.session_state["last_alert"] = (symbol, metric, condition, threshold)
+    return st.session_state["last_alert"]
 
 
-def render_backtest_panel() -> str:
-    """Render backtest panel."""
+def render_backtest_panel() -> Optional[str]:
+    """Render backtest panel; returns the symbol once the form is submitted."""
     st.subheader("📊 Mean-Reversion Backtest")
     
-    symbol = st.selectbox(
-        "Backtest Symbol",
-        ["BTCUSDT", "ETHUSDT"],
-        key="backtest_symbol"
-    )
+    with st.form("backtest_panel_form", border=False):
+        symbol = st.selectbox(
+            "Backtest Symbol",
+            SYMBOLS,
+            index=dashboard_symbol_index()
+        )
+        submitted = st.form_submit_button("▶️ Run Backtest", use_container_width=True)
     
-    return symbol
+    return symbol if submitted else None
 
 
 def render_footer() -> None:
     """Render footer."""
-    st.markdown("---")
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.caption("🔌 Connected to: Binance Futures WebSocket")
-    
-    with col2:
-        st.caption("⚡ Backend: FastAPI + SQLite")
-    
-    with col3:
-        st.caption("💡 Data updated every 5 seconds")
+    st.markdown(FOOTER_HTML, unsafe_allow_html=True)
 
 
-def apply_custom_css() -> None:
-    """Apply custom CSS styling."""
-    st.markdown("""
+def minify_css(css: str) -> str:
+    """Strip comments and all whitespace that CSS doesn't need."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r" ?([{};:,>]) ?", r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+# App-wide styles, header included, minified once at import.
+# Every full rerun has to re-send this, so it goes out as one small element.
+APP_CSS = minify_css("""
     <style>
         :root {
             --primary: #00D4FF;
@@ -294,7 +342,36 @@ def apply_custom_css() -> None:
             font-family: 'Inter', 'Rubik', sans-serif;
         }
         
-        .stMetric {
+        .header-title {
+            font-size: 3rem;
+            font-weight: 700;
+            background: linear-gradient(135deg, #00D4FF, #00FFB3);
+            -webkit-background-clip: text;
+            -webkit-text-fill-color: transparent;
+            margin-bottom: 0.5rem;
+        }
+        
+        .header-subtitle {
+            font-size: 1.1rem;
+            color: #a0aec0;
+            margin-bottom: 1rem;
+        }
+        
+        .footer-row {
+            display: flex;
+            justify-content: space-between;
+            font-size: 0.875rem;
+            color: #a0aec0;
+        }
+        
+        .stat-row {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(8rem, 1fr));
+            gap: 1rem;
+            margin-bottom: 1rem;
+        }
+        
+        .stat-card {
             background-color: var(--bg-card);
             padding: 1.5rem;
             border-radius: 0.75rem;
@@ -302,13 +379,23 @@ def apply_custom_css() -> None:
             box-shadow: 0 4px 6px rgba(0, 0, 0, 0.3);
         }
         
-        .stMetric label {
+        .stat-card .stat-label {
             font-size: 0.875rem;
             text-transform: uppercase;
             letter-spacing: 0.05em;
             color: #a0aec0;
         }
         
+        .stat-card .stat-value {
+            font-size: 1.75rem;
+            color: #e2e8f0;
+        }
+        
+        .stat-card .stat-delta {
+            font-size: 0.875rem;
+            color: #a0aec0;
+        }
+        
         .stButton button {
             background: linear-gradient(135deg, var(--primary), var(--secondary));
             color: var(--bg-dark);
@@ -330,7 +417,7 @@ def apply_custom_css() -> None:
             padding: 1rem;
             border-radius: 0.5rem;
             margin: 1rem 0;
-            animation: pulse 1s infinite;
+            animation: pulse 1s 3;
         }
         
         @keyframes pulse {
@@ -338,6 +425,10 @@ def apply_custom_css() -> None:
             50% { opacity: 0.7; }
         }
         
+        @media (prefers-reduced-motion: reduce) {
+            .alert-banner { animation: none; }
+        }
+        
         .connection-status {
             display: inline-flex;
             align-items: center;
@@ -356,4 +447,9 @@ def apply_custom_css() -> None:
             border-color: var(--danger);
         }
     </style>
-    """, unsafe_allow_html=True)
+""")
+
+
+def apply_custom_css() -> None:
+    """Apply custom CSS styling."""
+    st.markdown(APP_CSS, unsafe_allow_html=True)
@@ -0,0 +1,48 @@
+"""Background WebSocket subscription to the backend's analytics push feed."""
+import json
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+from websockets.sync.client import connect
+
+logger = logging.getLogger(__name__)
+
+
+class AnalyticsFeed(threading.Thread):
+    """
+    Keep the latest /analytics snapshot current from /ws/analytics.
+    
+    Runs as a daemon thread shared by every dashboard session, so reruns
+    read metrics from memory instead of polling the backend. `latest` is
+    empty while disconnected, which tells callers to fall back to HTTP.
+    """
+    
+    def __init__(self, url: str):
+        super().__init__(name="analytics-feed", daemon=True)
+        self.url = url
+        self.latest: Dict[str, Dict] = {}
+        self.updated_at: Optional[float] = None
+    
+    def run(self) -> None:
+        attempt = 0
+        while True:
+            try:
+                with connect(self.url, open_timeout=5) as ws:
+                    attempt = 0
+                    for frame in ws:
+                        batch = json.loads(frame)
+                        if batch:
+                            self.latest = batch[-1]
+                            self.updated_at = time.time()
+            except Exception as e:
+                logger.debug(f"Analytics feed disconnected: {e}")
+            
+            self.latest = {}
+            time.sleep(min(2 ** attempt, 30))
+            attempt += 1
+    
+    def get(self, symbol: str) -> Optional[Dict]:
+        """Latest pushed metrics for a symbol, if connected."""
+        return self.latest.get(symbol)
@@ -0,0 +1,76 @@
+"""Parity checks for AnalyticsEngine's incremental indicators."""
+import numpy as np
+import pytest
+
+from backend.analytics import EMA_ALPHA, EMA_PERIOD, SMA_PERIOD, AnalyticsEngine
+from backend.models import SampledWindow
+
+MAX_HISTORY = 50
+WINDOW_SIZE = 60
+N_WINDOWS = 300
+
+
+def _window(timestamp: float, symbol: str, price: float) -> SampledWindow:
+    return SampledWindow(timestamp, symbol, price, 0.0, price, price, 1.0, 1, price)
+
+
+def _random_walk(rng: np.random.Generator, start: float, scale: float) -> np.ndarray:
+    return start + np.cumsum(rng.normal(0.0, scale, N_WINDOWS))
+
+
+def _ema(prices: np.ndarray) -> float:
+    ema = prices[0]
+    for price in prices[1:]:
+        ema = price * EMA_ALPHA + ema * (1 - EMA_ALPHA)
+    return ema
+
+
+@pytest.fixture(scope="module")
+def run():
+    """Feed BTC and ETH windows at shared timestamps; collect every metric."""
+    rng = np.random.default_rng(7)
+    btc = _random_walk(rng, 60000.0, 25.0)
+    eth = _random_walk(rng, 3000.0, 2.0)
+    
+    engine = AnalyticsEngine(window_size=WINDOW_SIZE, max_history=MAX_HISTORY)
+    btc_metrics, eth_metrics = [], []
+    for i in range(N_WINDOWS):
+        btc_metrics.append(engine.process_window(_window(float(i), "BTCUSDT", btc[i])))
+        eth_metrics.append(engine.process_window(_window(float(i), "ETHUSDT", eth[i])))
+    return btc, eth, btc_metrics, eth_metrics
+
+
+def test_mean_and_std_track_the_retained_history(run):
+    btc, _, btc_metrics, _ = run
+    for i, m in enumerate(btc_metrics):
+        history = btc[max(0, i + 1 - MAX_HISTORY):i + 1]
+        assert m.mean_price == pytest.approx(history.mean(), rel=1e-12)
+        assert m.std_price == pytest.approx(history.std(), rel=1e-6, abs=1e-9)
+
+
+def test_z_score_uses_the_recent_window(run):
+    btc, _, btc_metrics, _ = run
+    for i, m in enumerate(btc_metrics[1:], start=1):
+        recent = btc[max(0, i + 1 - WINDOW_SIZE):i + 1]
+        assert m.z_score == pytest.approx((btc[i] - recent.mean()) / recent.std(), rel=1e-6, abs=1e-9)
+
+
+def test_sma_and_ema_match_direct_computation(run):
+    btc, _, btc_metrics, _ = run
+    for i, m in enumerate(btc_metrics):
+        assert m.sma_20 == pytest.approx(btc[max(0, i + 1 - SMA_PERIOD):i + 1].mean(), rel=1e-12)
+        
+        # EMA runs over every price seen, history eviction doesn't reset it
+        if i + 1 >= EMA_PERIOD:
+            assert m.ema_20 == pytest.approx(_ema(btc[:i + 1]), rel=1e-12)
+
+
+def test_pair_correlation_matches_corrcoef(run):
+    btc, eth, btc_metrics, eth_metrics = run
+    for i in range(2, N_WINDOWS - 1):
+        start = max(0, i + 1 - MAX_HISTORY)
+        expected = np.corrcoef(btc[start:i + 1], eth[start:i + 1])[0, 1]
+        
+        # ETH's window completes the pair at i; BTC's next window still sees pairs up to i
+        assert eth_metrics[i].correlation_btc_eth == pytest.approx(expected, abs=1e-8)
+        assert btc_metrics[i + 1].correlation_btc_eth == pytest.approx(expected, abs=1e-8)
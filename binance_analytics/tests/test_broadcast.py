@@ -0,0 +1,81 @@
+"""Wire-format checks for the /ws/prices delta stream."""
+import asyncio
+import json
+
+import pytest
+
+from backend.broadcast import BroadcastHub, PriceDeltaEncoder
+
+
+def _decode(messages, baselines=None):
+    """Client-side decode of /ws/prices messages into (symbol, t, price, qty) rows."""
+    baselines = {} if baselines is None else baselines
+    rows = []
+    for message in messages:
+        if isinstance(message, dict):
+            assert message["type"] == "baseline"
+            baselines[message["symbol"]] = message
+            continue
+        symbol, dt, dp, qty = message
+        base = baselines[symbol]  # KeyError: a delta arrived without its baseline
+        rows.append((symbol, base["t"] + dt, (base["p"] + dp) / base["price_scale"], qty / base["qty_scale"]))
+    return rows
+
+
+def _wire(messages):
+    return [json.loads(json.dumps(message)) for message in messages]
+
+
+def test_encode_decode_round_trip():
+    encoder = PriceDeltaEncoder()
+    messages = []
+    messages += encoder.encode("BTCUSDT", 1_000.0, 60000.123, 1.5)
+    messages += encoder.encode("BTCUSDT", 2_000.0, 60010.126, 0.25)
+    # A symbol seen for the first time mid-stream is announced by its own baseline
+    messages += encoder.encode("ETHUSDT", 2_000.0, 3000.5, 2.0)
+    messages += encoder.encode("ETHUSDT", 3_000.0, 2999.994, 0.000001)
+    
+    assert [m["symbol"] for m in messages if isinstance(m, dict)] == ["BTCUSDT", "ETHUSDT"]
+    assert isinstance(messages[0], dict) and isinstance(messages[3], dict)
+    
+    rows = _decode(_wire(messages))
+    assert rows == [
+        ("BTCUSDT", 1_000, pytest.approx(60000.12), pytest.approx(1.5)),
+        ("BTCUSDT", 2_000, pytest.approx(60010.13), pytest.approx(0.25)),
+        ("ETHUSDT", 2_000, pytest.approx(3000.50), pytest.approx(2.0)),
+        ("ETHUSDT", 3_000, pytest.approx(2999.99), pytest.approx(0.000001)),
+    ]
+    
+    # Deltas are integers relative to the baseline, not to the previous row
+    assert messages[2] == ["BTCUSDT", 1_000, 6_001_013 - 6_000_012, 250_000]
+
+
+def test_snapshot_lets_a_late_client_decode():
+    encoder = PriceDeltaEncoder()
+    encoder.encode("BTCUSDT", 1_000.0, 60000.0, 1.0)
+    encoder.encode("ETHUSDT", 1_000.0, 3000.0, 1.0)
+    
+    baselines = {}
+    _decode(_wire(encoder.snapshot()), baselines)
+    rows = _decode(_wire(encoder.encode("ETHUSDT", 5_000.0, 3001.25, 1.0)), baselines)
+    assert rows == [("ETHUSDT", 5_000, pytest.approx(3001.25), pytest.approx(1.0))]
+
+
+def test_overflowing_client_keeps_its_baseline():
+    encoder = PriceDeltaEncoder()
+    hub = BroadcastHub(max_queue=4, resync=encoder.snapshot)
+    
+    encoder.encode("BTCUSDT", 0.0, 60000.0, 1.0)
+    queue = asyncio.Queue(maxsize=hub.max_queue)
+    for message in encoder.snapshot():  # what serve() queues on connect
+        queue.put_nowait(json.dumps(message))
+    hub.clients.add(queue)
+    
+    # Nobody drains the queue, so it overflows several times over
+    for i in range(1, 20):
+        for message in encoder.encode("BTCUSDT", i * 1_000.0, 60000.0 + i, 1.0):
+            hub.publish(message)
+    
+    backlog = [json.loads(queue.get_nowait()) for _ in range(queue.qsize())]
+    assert backlog[0]["type"] == "baseline"
+    assert _decode(backlog)[-1] == ("BTCUSDT", 19_000, pytest.approx(60019.0), pytest.approx(1.0))